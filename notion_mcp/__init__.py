@@ -18,11 +18,40 @@ __version__ = "1.0.0"
 __author__ = "Sandra (Vienna, Austria)"
 __description__ = "Notion MCP Server with Austrian Efficiency"
 
-# Core imports for easy access
-from .automations import AutomationManager
-from .client import NotionClient
-from .collaboration import CollaborationManager
-from .databases import DatabaseManager
-from .pages import PageManager
-
-__all__ = ["AutomationManager", "CollaborationManager", "DatabaseManager", "NotionClient", "PageManager"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .automations import AutomationManager
+    from .client import NotionAPIError, NotionClient
+    from .collaboration import CollaborationManager
+    from .databases import DatabaseManager
+    from .pages import PageManager
+
+# Core exports for easy access, imported from their submodule on first attribute access (PEP 562)
+_LAZY_EXPORTS = {
+    "AutomationManager": ".automations",
+    "CollaborationManager": ".collaboration",
+    "DatabaseManager": ".databases",
+    "NotionAPIError": ".client",
+    "NotionClient": ".client",
+    "PageManager": ".pages",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(module, __name__), name)
+
+
+__all__ = [
+    "AutomationManager",
+    "CollaborationManager",
+    "DatabaseManager",
+    "NotionAPIError",
+    "NotionClient",
+    "PageManager",
+]
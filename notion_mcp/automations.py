@@ -153,7 +153,7 @@ class AutomationManager:
                 "status": "configured",
             }
 
-            logger.info(f"Automation configured: {automation_id} ({trigger_type})")
+            logger.info("Automation configured: %s (%s)", automation_id, trigger_type)
             return {
                 "success": True,
                 "automation_id": automation_id,
@@ -169,7 +169,7 @@ class AutomationManager:
             }
 
         except Exception as e:
-            logger.error(f"Failed to setup automation: {e}")
+            logger.error("Failed to setup automation: %s", e)
             return {"success": False, "error": str(e)}
 
     async def verify_webhook_subscription(self, verification_token: str) -> dict:
@@ -238,11 +238,11 @@ class AutomationManager:
                     "analysis_time": self.client.format_austrian_date(self.client.get_vienna_time()),
                 },
             }
-            logger.info(f"AI summary generated for page: {page_id}")
+            logger.info("AI summary generated for page: %s", page_id)
             return result
 
         except Exception as e:
-            logger.error(f"AI summary generation failed: {e}")
+            logger.error("AI summary generation failed: %s", e)
             return {"success": False, "error": str(e)}
 
     async def _call_llm(
@@ -296,7 +296,7 @@ class AutomationManager:
                 except _json.JSONDecodeError:
                     return {"summary": content[:1000], "key_points": []}
         except Exception as e:
-            logger.warning(f"LLM call failed, falling back to mock: {e}")
+            logger.warning("LLM call failed, falling back to mock: %s", e)
             return self._generate_mock_summary(text, summary_type, length)
 
     def _extract_text_from_blocks(self, blocks: list[dict[str, Any]]) -> str:
@@ -349,7 +349,7 @@ class AutomationManager:
             with open(filepath, "w", encoding="utf-8") as f:
                 f.write(f"Notion Export - {export_timestamp}\nScope: {scope}\nFormat: {format}")
 
-            logger.info(f"Export completed: {export_id} ({format}) to {filepath}")
+            logger.info("Export completed: %s (%s) to %s", export_id, format, filepath)
             return {
                 "success": True,
                 "export_config": {
@@ -363,7 +363,7 @@ class AutomationManager:
             }
 
         except Exception as e:
-            logger.error(f"Export failed: {e}")
+            logger.error("Export failed: %s", e)
             return {"success": False, "error": str(e)}
 
     async def import_workspace_data(
@@ -386,5 +386,5 @@ class AutomationManager:
                 "target_parent": target_parent_id,
             }
         except Exception as e:
-            logger.error(f"Import failed: {e}")
+            logger.error("Import failed: %s", e)
             return {"success": False, "error": str(e)}
@@ -10,16 +10,39 @@ Features:
 - Direct error communication (no gaslighting)
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Any
+from typing import Any, NoReturn
 
+import httpx
 import pytz
 from notion_client import AsyncClient
-from notion_client.errors import APIErrorCode, APIResponseError
+from notion_client.errors import APIErrorCode, APIResponseError, RequestTimeoutError
 
 logger = logging.getLogger("notionmcp.client")
 
+# Transient transport failures get one retry with backoff before surfacing to the caller
+_RETRYABLE = (httpx.TimeoutException, httpx.NetworkError, RequestTimeoutError)
+# Writes that are not idempotent: a timeout may fire after Notion committed them, so only
+# retry when the connection was never established and the request cannot have been sent
+_NON_IDEMPOTENT = frozenset({"pages.create", "databases.create", "comments.create", "blocks.children.append"})
+_MAX_ATTEMPTS = 2
+_RETRY_BACKOFF = 0.2
+
+
+def _is_connect_failure(e: BaseException) -> bool:
+    """Return True when the request failed before a connection to Notion was established."""
+    # notion_client re-raises every httpx timeout as a bare RequestTimeoutError; the httpx
+    # exception it caught is kept as the implicit __context__
+    if isinstance(e, RequestTimeoutError):
+        e = e.__cause__ or e.__context__
+    return isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+class NotionAPIError(Exception):
+    """Notion request failure with a short, user-facing message."""
+
 
 class NotionClient:
     """
@@ -57,45 +80,56 @@ class NotionClient:
         self.request_count = 0
         self.error_count = 0
 
-        logger.info(f"Notion client initialized ({token_type}) - Vienna timezone: {timezone_str}, API: {version}")
+        logger.info("Notion client initialized (%s) - Vienna timezone: %s, API: %s", token_type, timezone_str, version)
 
     async def _make_request(self, method: str, *args, **kwargs) -> Any:
         """
         Make API request with Austrian efficiency error handling and rate limiting.
         """
         self.request_count += 1
-
-        try:
-            # Resolve dotted method names for nested attribute access
-            parts = method.split(".")
-            client_method = self.client
-            for part in parts:
-                client_method = getattr(client_method, part)
-            result = await client_method(*args, **kwargs)
-
-            logger.debug(f"API request successful: {method} (Total: {self.request_count})")
+        idempotent = method not in _NON_IDEMPOTENT
+
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                # Resolve dotted method names for nested attribute access
+                client_method = self.client
+                for part in method.split("."):
+                    client_method = getattr(client_method, part)
+                result = await client_method(*args, **kwargs)
+            except _RETRYABLE as e:
+                if (idempotent or _is_connect_failure(e)) and attempt + 1 < _MAX_ATTEMPTS:
+                    logger.warning("Transient error in %s, retrying: %s", method, type(e).__name__)
+                    await asyncio.sleep(_RETRY_BACKOFF * 2**attempt)
+                    continue
+                self.error_count += 1
+                logger.error("Transient error in %s after %s attempt(s)", method, attempt + 1)
+                raise NotionAPIError(f"Request failed: {type(e).__name__} talking to Notion") from e
+            except APIResponseError as e:
+                self._raise_api_error(e)
+            except Exception as e:
+                self.error_count += 1
+                logger.error("Unexpected error in %s: %s", method, e)
+                raise NotionAPIError(f"Request failed: {e!s}") from e
+
+            logger.debug("API request successful: %s (Total: %s)", method, self.request_count)
             return result
 
-        except APIResponseError as e:
-            self.error_count += 1
-            logger.error(f"Notion API error: {e.code} - {getattr(e, 'body', str(e))}")
-
-            msg = getattr(e, "body", str(e))
-            if e.code == APIErrorCode.Unauthorized:
-                raise Exception("Notion API token is invalid or expired. Check your integration settings.") from e
-            elif e.code == APIErrorCode.RateLimited:
-                raise Exception("Rate limit exceeded. Please wait before making more requests.") from e
-            elif e.code == APIErrorCode.ObjectNotFound:
-                raise Exception("The requested page/database was not found. Check the ID and permissions.") from e
-            elif e.code == APIErrorCode.ValidationError:
-                raise Exception(f"Invalid request data: {msg}") from e
-            else:
-                raise Exception(f"Notion API error ({e.code}): {msg}") from e
-
-        except Exception as e:
-            self.error_count += 1
-            logger.error(f"Unexpected error in {method}: {e}")
-            raise Exception(f"Request failed: {e!s}") from e
+    def _raise_api_error(self, e: APIResponseError) -> NoReturn:
+        """Translate a Notion API error response into a NotionAPIError."""
+        self.error_count += 1
+        logger.error("Notion API error: %s - %s", e.code, getattr(e, "body", str(e)))
+
+        msg = getattr(e, "body", str(e))
+        if e.code == APIErrorCode.Unauthorized:
+            raise NotionAPIError("Notion API token is invalid or expired. Check your integration settings.") from e
+        elif e.code == APIErrorCode.RateLimited:
+            raise NotionAPIError("Rate limit exceeded. Please wait before making more requests.") from e
+        elif e.code == APIErrorCode.ObjectNotFound:
+            raise NotionAPIError("The requested page/database was not found. Check the ID and permissions.") from e
+        elif e.code == APIErrorCode.ValidationError:
+            raise NotionAPIError(f"Invalid request data: {msg}") from e
+        else:
+            raise NotionAPIError(f"Notion API error ({e.code}): {msg}") from e
 
     def get_vienna_time(self) -> datetime:
         """Get current time in Vienna timezone for Austrian efficiency."""
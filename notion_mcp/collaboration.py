@@ -13,6 +13,8 @@ Features:
 import logging
 from typing import Any
 
+from .client import NotionAPIError
+
 logger = logging.getLogger("notionmcp.collaboration")
 
 
@@ -72,12 +74,12 @@ class CollaborationManager:
                 "parent_comment_id": parent_comment_id,
             }
 
-            logger.info(f"Comment added to page: {page_id}")
+            logger.info("Comment added to page: %s", page_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to add comment to {page_id}: {e}")
-            raise Exception(f"Comment creation failed: {e!s}") from e
+            logger.error("Failed to add comment to %s: %s", page_id, e)
+            raise
 
     async def get_comments(
         self, page_id: str, include_resolved: bool = False, sort_by: str = "created_time", limit: int = 50
@@ -131,12 +133,12 @@ class CollaborationManager:
 
             processed = processed[:limit]
 
-            logger.info(f"Retrieved {len(processed)} comments from page: {page_id}")
+            logger.info("Retrieved %s comments from page: %s", len(processed), page_id)
             return processed
 
         except Exception as e:
-            logger.error(f"Failed to get comments from {page_id}: {e}")
-            raise Exception(f"Comment retrieval failed: {e!s}") from e
+            logger.error("Failed to get comments from %s: %s", page_id, e)
+            raise
 
     def _extract_comment_text(self, rich_text: list[dict[str, Any]]) -> str:
         """Extract plain text from rich_text array."""
@@ -216,12 +218,12 @@ class CollaborationManager:
             elif sort_by == "email":
                 processed_users.sort(key=lambda x: x.get("email", "").lower())
 
-            logger.info(f"Retrieved {len(processed_users)} workspace users")
+            logger.info("Retrieved %s workspace users", len(processed_users))
             return processed_users
 
         except Exception as e:
-            logger.error(f"Failed to get workspace users: {e}")
-            raise Exception(f"User retrieval failed: {e!s}") from e
+            logger.error("Failed to get workspace users: %s", e)
+            raise
 
     async def get_user_details(self, user_id: str) -> dict[str, Any]:
         """
@@ -249,12 +251,12 @@ class CollaborationManager:
                 "language": "Unknown",  # Not available via API
             }
 
-            logger.info(f"Retrieved user details: {user_id}")
+            logger.info("Retrieved user details: %s", user_id)
             return user_details
 
         except Exception as e:
-            logger.error(f"Failed to get user details {user_id}: {e}")
-            raise Exception(f"User details retrieval failed: {e!s}") from e
+            logger.error("Failed to get user details %s: %s", user_id, e)
+            raise
 
     async def get_page_permissions(self, page_id: str) -> dict[str, Any]:
         """
@@ -281,12 +283,12 @@ class CollaborationManager:
                 "message": "Notion API has limited permission querying - check workspace settings manually",
             }
 
-            logger.info(f"Retrieved basic permission info for page: {page_id}")
+            logger.info("Retrieved basic permission info for page: %s", page_id)
             return permissions
 
         except Exception as e:
-            logger.error(f"Failed to get page permissions {page_id}: {e}")
-            raise Exception(f"Permission retrieval failed: {e!s}") from e
+            logger.error("Failed to get page permissions %s: %s", page_id, e)
+            raise
 
     async def get_collaboration_stats(self, page_id: str | None = None) -> dict[str, Any]:
         """
@@ -321,7 +323,7 @@ class CollaborationManager:
                             "last_edited_by": page.get("last_edited_by", {}),
                         }
                     )
-                except Exception as page_error:
+                except NotionAPIError as page_error:
                     stats["page_error"] = str(page_error)
             else:
                 # Workspace-wide collaboration stats
@@ -338,15 +340,15 @@ class CollaborationManager:
                             "api_usage": await self.client.get_stats(),
                         }
                     )
-                except Exception as workspace_error:
+                except NotionAPIError as workspace_error:
                     stats["workspace_error"] = str(workspace_error)
 
-            logger.info(f"Collaboration stats generated: {stats.get('scope', 'page')}")
+            logger.info("Collaboration stats generated: %s", stats.get("scope", "page"))
             return stats
 
         except Exception as e:
-            logger.error(f"Failed to get collaboration stats: {e}")
-            raise Exception(f"Stats retrieval failed: {e!s}") from e
+            logger.error("Failed to get collaboration stats: %s", e)
+            raise
 
     async def mention_user_in_comment(
         self, page_id: str, content: str, mentioned_user_id: str, user_name: str | None = None
@@ -380,9 +382,9 @@ class CollaborationManager:
 
             comment["mentioned_user"] = {"id": mentioned_user_id, "name": user_name}
 
-            logger.info(f"Comment with mention created: {page_id} -> @{user_name}")
+            logger.info("Comment with mention created: %s -> @%s", page_id, user_name)
             return comment
 
         except Exception as e:
-            logger.error(f"Failed to create comment with mention: {e}")
-            raise Exception(f"Mention comment failed: {e!s}") from e
+            logger.error("Failed to create comment with mention: %s", e)
+            raise
@@ -210,7 +210,7 @@ class PageManager:
                             db_properties = self._build_page_properties(properties)
                             page_data["properties"].update(db_properties)
                     except Exception:
-                        raise Exception(f"Parent ID {parent_id} is not a valid page or data source") from None
+                        raise ValueError(f"Parent ID {parent_id} is not a valid page or data source") from None
             else:
                 # Create in workspace root
                 page_data["parent"] = {"type": "workspace", "workspace": True}
@@ -224,11 +224,11 @@ class PageManager:
                 if blocks_to_add:
                     await self.client.append_block_children(block_id=page["id"], children=blocks_to_add)
 
-            logger.info(f"Page created successfully: {title} ({page['id']})")
+            logger.info("Page created successfully: %s (%s)", title, page["id"])
             return page
 
         except Exception as e:
-            logger.error(f"Failed to create page '{title}': {e}")
+            logger.error("Failed to create page '%s': %s", title, e)
             raise
 
     async def update_page(
@@ -269,11 +269,11 @@ class PageManager:
                 if blocks:
                     await self.client.append_block_children(block_id=page_id, children=blocks)
 
-            logger.info(f"Page updated successfully: {page_id}")
+            logger.info("Page updated successfully: %s", page_id)
             return page
 
         except Exception as e:
-            logger.error(f"Failed to update page {page_id}: {e}")
+            logger.error("Failed to update page %s: %s", page_id, e)
             raise
 
     async def get_page_content(
@@ -295,11 +295,11 @@ class PageManager:
                 result["blocks"] = blocks
                 result["children_count"] = len(blocks)
 
-            logger.info(f"Page content retrieved: {page_id} ({result['children_count']} blocks)")
+            logger.info("Page content retrieved: %s (%s blocks)", page_id, result["children_count"])
             return result
 
         except Exception as e:
-            logger.error(f"Failed to get page content {page_id}: {e}")
+            logger.error("Failed to get page content %s: %s", page_id, e)
             raise
 
     async def get_page_markdown(self, page_id: str) -> dict[str, Any]:
@@ -308,14 +308,14 @@ class PageManager:
         """
         try:
             result = await self.client.retrieve_page_markdown(page_id)
-            logger.info(f"Page markdown retrieved: {page_id}")
+            logger.info("Page markdown retrieved: %s", page_id)
             return {
                 "page_id": page_id,
                 "markdown": result.get("markdown", ""),
                 "raw": result,
             }
         except Exception as e:
-            logger.error(f"Failed to get page markdown {page_id}: {e}")
+            logger.error("Failed to get page markdown %s: %s", page_id, e)
             raise
 
     async def update_page_markdown(self, page_id: str, markdown: str) -> dict[str, Any]:
@@ -324,13 +324,13 @@ class PageManager:
         """
         try:
             result = await self.client.update_page_markdown(page_id, markdown)
-            logger.info(f"Page markdown updated: {page_id}")
+            logger.info("Page markdown updated: %s", page_id)
             return {
                 "page_id": page_id,
                 "result": result,
             }
         except Exception as e:
-            logger.error(f"Failed to update page markdown {page_id}: {e}")
+            logger.error("Failed to update page markdown %s: %s", page_id, e)
             raise
 
     async def _get_all_blocks(self, block_id: str, max_depth: int = 10, current_depth: int = 0) -> list[dict[str, Any]]:
@@ -390,11 +390,11 @@ class PageManager:
             response = await self.client.search(query=query, filter=search_filter, sort=search_sort, page_size=limit)
 
             results = response.get("results", [])
-            logger.info(f"Search completed: '{query}' returned {len(results)} results")
+            logger.info("Search completed: '%s' returned %s results", query, len(results))
             return results
 
         except Exception as e:
-            logger.error(f"Search failed for query '{query}': {e}")
+            logger.error("Search failed for query '%s': %s", query, e)
             raise
 
     async def archive_page(
@@ -414,7 +414,7 @@ class PageManager:
                     result["backup_created"] = True
                     result["backup_time"] = self.client.format_austrian_date(self.client.get_vienna_time())
                 except Exception as backup_error:
-                    logger.warning(f"Backup creation failed: {backup_error}")
+                    logger.warning("Backup creation failed: %s", backup_error)
 
             if permanent_delete:
                 # Notion API doesn't support permanent deletion
@@ -428,11 +428,11 @@ class PageManager:
                 result["action"] = "archived"
 
             result["page"] = page
-            logger.info(f"Page {result['action']}: {page_id}")
+            logger.info("Page %s: %s", result["action"], page_id)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to archive page {page_id}: {e}")
+            logger.error("Failed to archive page %s: %s", page_id, e)
             raise
 
     async def get_page_tree(self, page_id: str, max_depth: int = 3) -> dict[str, Any]:
@@ -458,5 +458,5 @@ class PageManager:
             return result
 
         except Exception as e:
-            logger.error(f"Failed to get page tree {page_id}: {e}")
+            logger.error("Failed to get page tree %s: %s", page_id, e)
             raise
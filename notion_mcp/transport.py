@@ -127,7 +127,7 @@ def resolve_transport(args: argparse.Namespace) -> TransportType:
         # Fall back to environment variable
         env_transport = os.getenv(ENV_TRANSPORT, "stdio").lower()
         if env_transport not in ("stdio", "http"):
-            logger.warning(f"Invalid {ENV_TRANSPORT}='{env_transport}', defaulting to stdio")
+            logger.warning("Invalid %s='%s', defaulting to stdio", ENV_TRANSPORT, env_transport)
             return "stdio"
         return env_transport  # type: ignore
 
@@ -174,13 +174,13 @@ async def run_server_async(
     # Configure logging
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
-        logger.debug(f"Debug logging enabled for {server_name}")
+        logger.debug("Debug logging enabled for %s", server_name)
 
     config = resolve_config(args)
     transport = config["transport"]
 
-    logger.info(f"Starting {server_name} SOTA 2026")
-    logger.info(f"Transport: {transport.upper()}")
+    logger.info("Starting %s SOTA 2026", server_name)
+    logger.info("Transport: %s", transport.upper())
 
     try:
         if transport == "stdio":
@@ -192,19 +192,19 @@ async def run_server_async(
             path = config["path"]
 
             if http_app:
-                logger.info(f"Running custom HTTP app with MCP mounted at {path}: http://{host}:{port}")
+                logger.info("Running custom HTTP app with MCP mounted at %s: http://%s:%s", path, host, port)
                 import uvicorn
 
                 config_uv = uvicorn.Config(http_app, host=host, port=port, log_level="info")
                 server = uvicorn.Server(config_uv)
                 await server.serve()
             else:
-                logger.info(f"Running in HTTP Streamable mode: http://{host}:{port}{path}")
+                logger.info("Running in HTTP Streamable mode: http://%s:%s%s", host, port, path)
                 await mcp_app.run_http_async(host=host, port=port, path=path)
     except asyncio.CancelledError:
-        logger.info(f"{server_name} shutdown requested")
+        logger.info("%s shutdown requested", server_name)
     except Exception as e:
-        logger.error(f"{server_name} failed: {e}", exc_info=True)
+        logger.error("%s failed: %s", server_name, e, exc_info=True)
         raise
 
 
@@ -56,9 +56,9 @@ async def deploy_worker(project_dir: str | None = None) -> dict[str, Any]:
     cwd = project_dir or os.getcwd()
     result = _run_ntn(["workers", "deploy"], timeout=120)
     if result.get("success"):
-        logger.info(f"Worker deployed from {cwd}")
+        logger.info("Worker deployed from %s", cwd)
     else:
-        logger.error(f"Worker deploy failed from {cwd}: {result.get('error')}")
+        logger.error("Worker deploy failed from %s: %s", cwd, result.get("error"))
     return result
 
 
@@ -76,7 +76,7 @@ async def scaffold_worker(project_dir: str) -> dict[str, Any]:
     path.mkdir(parents=True, exist_ok=True)
     result = _run_ntn(["workers", "new"], timeout=60)
     if result.get("success"):
-        logger.info(f"Worker scaffolded at {project_dir}")
+        logger.info("Worker scaffolded at %s", project_dir)
     return result
 
 
@@ -12,16 +12,24 @@ Status: Production-Ready (SOTA 2026)
 """
 
 import asyncio
+import atexit
 import collections
 import datetime
+import functools
+import inspect
+import logging
 import os
+import queue
+import sys
 import time
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 import structlog
-import yaml
 from fastapi import Body, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastmcp import FastMCP
@@ -29,17 +37,20 @@ from fastmcp.server import create_proxy
 from pydantic import Field
 
 from notion_mcp import workers as notion_workers
-from notion_mcp.automations import AutomationManager
-from notion_mcp.client import NotionClient
-from notion_mcp.collaboration import CollaborationManager
-from notion_mcp.databases import DatabaseManager
-from notion_mcp.pages import PageManager
+from notion_mcp.client import NotionAPIError, NotionClient
 from notion_mcp.plugins import PluginManager
-from notion_mcp.rag.orchestrator import RAGOrchestrator
 from notion_mcp.transport import (
     run_server_async,
 )
 
+if TYPE_CHECKING:
+    # Imported for real inside _services() / _rag() on first use
+    from notion_mcp.automations import AutomationManager
+    from notion_mcp.collaboration import CollaborationManager
+    from notion_mcp.databases import DatabaseManager
+    from notion_mcp.pages import PageManager
+    from notion_mcp.rag.orchestrator import RAGOrchestrator
+
 _LOG_BUFFER_MAX = 5000
 _log_buffer: collections.deque[dict] = collections.deque(maxlen=_LOG_BUFFER_MAX)
 _log_counter = 0
@@ -61,40 +72,63 @@ def _log_processor(logger_, method_name, event_dict):
     return event_dict
 
 
+def _json_renderer() -> structlog.processors.JSONRenderer:
+    """Render log events with orjson when installed; stdlib json otherwise."""
+    try:
+        import orjson
+    except ImportError:
+        return structlog.processors.JSONRenderer()
+
+    def _dumps(obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+    return structlog.processors.JSONRenderer(serializer=_dumps)
+
+
+# One level for structlog and stdlib; same variable run_server.py hands to uvicorn
+_LOG_LEVEL = logging.getLevelNamesMapping().get(os.getenv("NOTION_LOG_LEVEL", "info").upper(), logging.INFO)
+logging.getLogger().setLevel(_LOG_LEVEL)
+
 # Configure structured logging with in-memory ring buffer capture
+# The filtering bound logger drops calls below _LOG_LEVEL before any processor runs
 structlog.configure(
     processors=[
-        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
         _log_processor,
-        structlog.processors.JSONRenderer(),
+        _json_renderer(),
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.stdlib.BoundLogger,
+    wrapper_class=structlog.make_filtering_bound_logger(_LOG_LEVEL),
     cache_logger_on_first_use=True,
 )
 
-logger = structlog.get_logger(__name__)
+# Hand stdlib log records to a queue; a listener thread does the stderr writes off the event loop
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(), respect_handler_level=True)
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Resolve the lazy proxy once (structlog is configured above) so log calls skip the per-call proxy lookup
+logger = structlog.get_logger(__name__).bind()
 
 
 # Load configuration with Austrian context
+_CONFIG_PATH = Path(__file__).resolve().parent / "config" / "settings.yaml"
+
+
 def load_config() -> dict[str, Any]:
     """Load configuration from YAML files with Vienna defaults"""
-    config_path = os.path.join(os.path.dirname(__file__), "config", "settings.yaml")
     try:
-        with open(config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-        logger.info("Configuration loaded", config_path=config_path)
-        return config
+        raw = _CONFIG_PATH.read_bytes()
     except FileNotFoundError:
-        logger.warning("Config file not found, using defaults", config_path=config_path)
+        logger.warning("Config file not found, using defaults", config_path=str(_CONFIG_PATH))
         return {
             "server": {
                 "name": "Notion Workspace Management MCP 🗃️",
@@ -103,6 +137,14 @@ def load_config() -> dict[str, Any]:
             }
         }
 
+    import yaml  # deferred: only needed when a config file is actually present
+
+    # libyaml's C loader when PyYAML was built with it; same safe-subset semantics as safe_load
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    config = yaml.load(raw, Loader=loader)  # noqa: S506
+    logger.info("Configuration loaded", config_path=str(_CONFIG_PATH))
+    return config
+
 
 # Server lifespan for startup/shutdown lifecycle
 @asynccontextmanager
@@ -118,13 +160,8 @@ async def server_lifespan(app: FastMCP):
 
 
 # Initialize FastMCP 3.1 Server with Austrian Efficiency
-_MCP_INSTRUCTIONS = "You are NotionMCP, a comprehensive MCP server for Notion workspace management."
-
-mcp = FastMCP(
-    "notion-mcp",
-    version="1.1.0",
-    instructions=_MCP_INSTRUCTIONS
-    + """
+# One literal, built at compile time rather than concatenated at import
+_MCP_INSTRUCTIONS = """You are NotionMCP, a comprehensive MCP server for Notion workspace management.
 
 CORE CAPABILITIES:
 - Page Management: Create, update, search, archive pages with German/Japanese character support
@@ -156,7 +193,12 @@ ERROR HANDLING:
 - Authentication errors include token setup instructions
 - Permission errors specify which workspace needs access
 - Rate limit errors provide wait time and optimization suggestions
-- Direct communication: No euphemisms, clear actionable feedback""",
+- Direct communication: No euphemisms, clear actionable feedback"""
+
+mcp = FastMCP(
+    "notion-mcp",
+    version="1.1.0",
+    instructions=_MCP_INSTRUCTIONS,
     lifespan=server_lifespan,
 )
 
@@ -168,8 +210,16 @@ if MCP_BRIDGE_URLS:
         if url:
             mcp.add_provider(create_proxy(url))
 
+
 # Initialize RAG Orchestrator for knowledge management
-rag = RAGOrchestrator()
+# Built on first search: it opens LanceDB and loads the embedding model, which startup shouldn't wait for
+@functools.lru_cache(maxsize=1)
+def _rag() -> "RAGOrchestrator":
+    """Return the shared RAG orchestrator, creating it on first use."""
+    from notion_mcp.rag.orchestrator import RAGOrchestrator
+
+    return RAGOrchestrator()
+
 
 # Initialize FastAPI app for SOTA Dashboard
 app = FastAPI(title="NotionMCP SOTA Dashboard")
@@ -231,9 +281,7 @@ async def get_status():
     authenticated = False
     workspace_name = "Not Connected"
     try:
-        initialize_notion_client()
-        if notion_client is None:
-            raise RuntimeError("notion_client is None after initialization")
+        _services()
         authenticated = True
         workspace_name = "Notion Workspace"
     except Exception as exc:
@@ -279,15 +327,10 @@ async def get_skills():
 @app.post("/api/configure/token")
 async def set_notion_token(token: str = Body(..., embed=True)):
     """Store Notion token via webapp (no .env editing needed)."""
-    global notion_client, page_manager, db_manager, collab_manager, automation_manager
-    notion_client = None
-    page_manager = None
-    db_manager = None
-    collab_manager = None
-    automation_manager = None
     _write_stored_token(token)
+    _services.cache_clear()
     try:
-        initialize_notion_client()
+        _services()
         return {"success": True, "authenticated": True, "message": "Token saved and connected."}
     except Exception as e:
         logger.exception("Token save succeeded but connection failed")
@@ -375,8 +418,7 @@ async def install_plugin(plugin_id: str):
 async def import_data(file_path: str = Body(..., embed=True), target_id: str = Body(..., embed=True)):
     """API endpoint for data migration."""
     try:
-        initialize_notion_client()
-        return await automation_manager.import_workspace_data(file_path, target_id)
+        return await _services().auto.import_workspace_data(file_path, target_id)
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -385,8 +427,7 @@ async def import_data(file_path: str = Body(..., embed=True), target_id: str = B
 async def export_data(format: str = "json"):
     """API endpoint for data export."""
     try:
-        initialize_notion_client()
-        return await automation_manager.export_workspace_data(format=format)
+        return await _services().auto.export_workspace_data(format=format)
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -395,8 +436,7 @@ async def export_data(format: str = "json"):
 async def get_page(page_id: str):
     """Return page metadata and content blocks."""
     try:
-        initialize_notion_client()
-        content = await page_manager.get_page_content(page_id, include_children=True, block_depth=5)
+        content = await _services().pages.get_page_content(page_id, include_children=True, block_depth=5)
         page_data = content.get("page", {})
         title = "Untitled"
         props = page_data.get("properties", {})
@@ -430,8 +470,7 @@ async def get_page(page_id: str):
 async def get_recent(limit: int = 20):
     """Return recent pages and databases from the Notion workspace."""
     try:
-        initialize_notion_client()
-        results = await page_manager.search_pages(query="", sort_by="last_edited_time", limit=limit)
+        results = await _services().pages.search_pages(query="", sort_by="last_edited_time", limit=limit)
         items = []
         for r in results:
             obj_type = r.get("object", "page")
@@ -461,8 +500,7 @@ async def get_recent(limit: int = 20):
 async def get_stats():
     """Return real-time Notion workspace telemetry."""
     try:
-        initialize_notion_client()
-        stats = await notion_client.get_stats()
+        stats = await _services().client.get_stats()
         return stats
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -533,13 +571,13 @@ async def discover_llms():
 @app.post("/api/search")
 async def semantic_search(query: str = Body(..., embed=True)):
     """SOTA Semantic Search endpoint."""
-    return await rag.semantic_search(query)
+    return await _rag().semantic_search(query)
 
 
 @app.post("/api/chat")
 async def chat_interaction(message: str = Body(..., embed=True), model_url: str | None = None):
     """RAG-powered chat with local LLM integration."""
-    context = await rag.semantic_search(message, limit=3)
+    context = await _rag().semantic_search(message, limit=3)
     context_text = "\n".join([f"Source: {c['title']}\nContent: {c['content']}" for c in context])
 
     prompt = f"Context from Notion:\n{context_text}\n\nUser Question: {message}\n\nPlease answer based on the context."
@@ -555,10 +593,9 @@ async def chat_interaction(message: str = Body(..., embed=True), model_url: str
 @app.post("/api/webhooks/notion")
 async def notion_webhook_receiver(request: Request):
     """Receive Notion webhook events (verification + content events)."""
-    initialize_notion_client()
     body = await request.json()
     headers = dict(request.headers)
-    result = await automation_manager.receive_webhook_event(headers, body)
+    result = await _services().auto.receive_webhook_event(headers, body)
     logger.info("Webhook event received", event_type=result.get("event_type", "unknown"))
     return result
 
@@ -566,8 +603,7 @@ async def notion_webhook_receiver(request: Request):
 @app.get("/api/webhooks/events")
 async def get_webhook_events(limit: int = 50, event_type: str | None = None):
     """List stored webhook events."""
-    initialize_notion_client()
-    return await automation_manager.list_webhook_events(limit=limit, event_type=event_type)
+    return await _services().auto.list_webhook_events(limit=limit, event_type=event_type)
 
 
 _DATA_DIR = Path(__file__).resolve().parent / "exports"
@@ -590,80 +626,159 @@ def _write_stored_token(token: str) -> None:
     _TOKEN_FILE.write_text(token, encoding="utf-8")
 
 
-# Initialize Notion client with Austrian efficiency
-# Note: Initialization happens lazily to avoid import-time failures
-notion_client = None
-page_manager = None
-db_manager = None
-collab_manager = None
-automation_manager = None
-
+def _import_file(name: str) -> Path:
+    """Resolve a bulk-import file name inside the import directory (NOTION_IMPORT_DIR, default exports/imports)."""
+    import_dir = Path(os.getenv("NOTION_IMPORT_DIR", _DATA_DIR / "imports")).resolve()
+    path = (import_dir / name).resolve()
+    if not path.is_relative_to(import_dir) or path.suffix.lower() not in (".csv", ".json"):
+        raise ValueError(f"Import file must be a .csv or .json file inside {import_dir}")
+    return path
 
-def initialize_notion_client():
-    """Initialize Notion client and managers."""
-    global notion_client, page_manager, db_manager, collab_manager, automation_manager
 
-    if notion_client is not None:
-        return  # Already initialized
+@dataclass(frozen=True, slots=True)
+class NotionEnv:
+    """Snapshot of the Notion connection settings read from the environment."""
 
-    # Check env vars first, then file-based token (set via webapp Settings)
-    token = os.getenv("NOTION_TOKEN") or os.getenv("NOTION_PAT") or _read_stored_token()
-    has_file_token = bool(_read_stored_token())
-    token_type = "pat" if (os.getenv("NOTION_PAT") or has_file_token) and not os.getenv("NOTION_TOKEN") else "internal"
-
-    if not token:
-        raise ValueError("Notion token required. Set NOTION_TOKEN or NOTION_PAT.")
+    token: str | None
+    token_type: str
+    version: str
+    timeout: int
 
-    try:
-        notion_client = NotionClient(
-            token=token,
+    @classmethod
+    def load(cls) -> "NotionEnv":
+        """Read env vars first, then the file-based token (set via webapp Settings)."""
+        env_token = os.getenv("NOTION_TOKEN")
+        return cls(
+            token=env_token or os.getenv("NOTION_PAT") or _read_stored_token(),
+            token_type="internal" if env_token else "pat",
             version=os.getenv("NOTION_VERSION", "2026-03-11"),
             timeout=int(os.getenv("NOTION_TIMEOUT", "30")),
-            token_type=token_type,
         )
 
-        # Initialize managers
-        page_manager = PageManager(notion_client)
-        db_manager = DatabaseManager(notion_client)
-        collab_manager = CollaborationManager(notion_client)
-        automation_manager = AutomationManager(notion_client)
 
-        logger.info(
-            "Notion client initialized successfully",
-            message="Austrian efficiency activated",
+@dataclass(frozen=True, slots=True)
+class Services:
+    """Notion client and the managers built on top of it."""
+
+    client: NotionClient
+    pages: "PageManager"
+    dbs: "DatabaseManager"
+    collab: "CollaborationManager"
+    auto: "AutomationManager"
+
+
+# Initialize Notion client with Austrian efficiency
+# Note: Initialization happens lazily to avoid import-time failures; cache_clear() after a token change.
+# Failed attempts are not cached, so the next call re-reads a token supplied later via env or file.
+@functools.lru_cache(maxsize=1)
+def _services() -> Services:
+    """Initialize Notion client and managers on first use, then return the cached instances."""
+    env = NotionEnv.load()
+    if not env.token:
+        raise ValueError("Notion token required. Set NOTION_TOKEN or NOTION_PAT.")
+
+    # Managers load on first use so introspection-only launches never import them
+    from notion_mcp.automations import AutomationManager
+    from notion_mcp.collaboration import CollaborationManager
+    from notion_mcp.databases import DatabaseManager
+    from notion_mcp.pages import PageManager
+
+    try:
+        client = NotionClient(
+            token=env.token,
+            version=env.version,
+            timeout=env.timeout,
+            token_type=env.token_type,
+        )
+        services = Services(
+            client=client,
+            pages=PageManager(client),
+            dbs=DatabaseManager(client),
+            collab=CollaborationManager(client),
+            auto=AutomationManager(client),
         )
     except Exception as e:
         logger.error("Failed to initialize Notion client", error=str(e))
         raise
 
+    logger.info(
+        "Notion client initialized successfully",
+        message="Austrian efficiency activated",
+    )
+    return services
+
 
 _READ_ONLY = {"readonly": True}
 _MUTATING = {}
 _DESTRUCTIVE = {}
 
+# Shared parameter annotations for arguments documented identically across tools
+Cursor = Annotated[str | None, Field(description="Pagination cursor")]
+ArchiveFlag = Annotated[bool | None, Field(description="Archive status")]
+
+
+def _failure(error: Exception, message: str) -> dict[str, Any]:
+    """Build the standard failure response returned by the page/database/collaboration tools."""
+    return {"success": False, "error": str(error), "message": message}
+
+
+# Failures a tool reports as a _failure response: Notion rejections, bad input, unreadable import files.
+# Anything else is a bug and propagates to FastMCP, which returns it as a tool error.
+_EXPECTED_ERRORS = (NotionAPIError, ValueError, OSError)
+
+
+def _tool_guard(
+    log_event: str, message: str, **log_fields: str
+) -> Callable[[Callable[..., Awaitable[dict[str, Any]]]], Callable[..., Awaitable[dict[str, Any]]]]:
+    """
+    Log an expected exception raised by the wrapped tool and return it as a _failure response.
+
+    log_fields maps log keys to the tool arguments logged alongside the error.
+    """
+
+    def decorate(fn: Callable[..., Awaitable[dict[str, Any]]]) -> Callable[..., Awaitable[dict[str, Any]]]:
+        signature = inspect.signature(fn)
+        tool_logger = logger.bind(tool=fn.__name__)
+
+        @functools.wraps(fn)
+        async def guarded(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            try:
+                return await fn(*args, **kwargs)
+            except _EXPECTED_ERRORS as e:
+                arguments = signature.bind_partial(*args, **kwargs).arguments
+                tool_logger.error(
+                    log_event, **{key: arguments.get(arg) for key, arg in log_fields.items()}, error=str(e)
+                )
+                return _failure(e, message)
+
+        return guarded
+
+    return decorate
+
+
 # 🎛️ SOTA Portmanteau Toolsets (Consolidated Implementation)
 
 
 @mcp.tool(annotations=_DESTRUCTIVE)
 async def manage_notion_data(
-    operation: str = Field(description="CRUD operation: create, retrieve, update, archive, restore"),
-    entity_type: str = Field(description="Entity type: page, data_source, block"),
-    entity_id: str | None = Field(default=None, description="Target entity ID (required except for create)"),
-    parent_id: str | None = Field(default=None, description="Parent ID (required for create)"),
-    title: str | None = Field(default=None, description="Title/Name for the entity"),
-    content: str | None = Field(default=None, description="Content (text or block formatted)"),
-    properties: dict[str, Any] | None = Field(default=None, description="Structured properties"),
-    children: list[dict[str, Any]] | None = Field(default=None, description="Child blocks"),
-    extra_params: dict[str, Any] | None = Field(default=None, description="Advanced API parameters"),
+    operation: Annotated[str, Field(description="CRUD operation: create, retrieve, update, archive, restore")],
+    entity_type: Annotated[str, Field(description="Entity type: page, data_source, block")],
+    entity_id: Annotated[str | None, Field(description="Target entity ID (required except for create)")] = None,
+    parent_id: Annotated[str | None, Field(description="Parent ID (required for create)")] = None,
+    title: Annotated[str | None, Field(description="Title/Name for the entity")] = None,
+    content: Annotated[str | None, Field(description="Content (text or block formatted)")] = None,
+    properties: Annotated[dict[str, Any] | None, Field(description="Structured properties")] = None,
+    children: Annotated[list[dict[str, Any]] | None, Field(description="Child blocks")] = None,
+    extra_params: Annotated[dict[str, Any] | None, Field(description="Advanced API parameters")] = None,
 ) -> dict[str, Any]:
     """Consolidated CRUD management for Notion Pages, Data Sources, and Blocks."""
     try:
-        initialize_notion_client()
+        services = _services()
         extra_params = extra_params or {}
 
         if operation == "create":
             if entity_type == "page":
-                result = await page_manager.create_page(
+                result = await services.pages.create_page(
                     title=title,
                     content=content,
                     parent_id=parent_id,
@@ -671,7 +786,7 @@ async def manage_notion_data(
                     children=children,
                 )
             elif entity_type == "data_source":
-                result = await db_manager.create_database(
+                result = await services.dbs.create_database(
                     title=title,
                     parent_id=parent_id,
                     properties_schema=properties or {},
@@ -698,11 +813,11 @@ async def manage_notion_data(
 
         if operation == "retrieve":
             if entity_type == "page":
-                result = await page_manager.get_page_content(entity_id, **extra_params)
+                result = await services.pages.get_page_content(entity_id, **extra_params)
             elif entity_type == "data_source":
-                result = await db_manager.get_database(entity_id)
+                result = await services.dbs.get_database(entity_id)
             elif entity_type == "block":
-                result = await notion_client.get_block_children(entity_id)
+                result = await services.client.get_block_children(entity_id)
             else:
                 return {
                     "success": False,
@@ -712,9 +827,9 @@ async def manage_notion_data(
 
         if operation == "update":
             if entity_type == "page":
-                await page_manager.update_page(entity_id, title=title, content=content, properties=properties)
+                await services.pages.update_page(entity_id, title=title, content=content, properties=properties)
             elif entity_type == "data_source":
-                await db_manager.update_database(entity_id, title=title, properties=properties)
+                await services.dbs.update_database(entity_id, title=title, properties=properties)
             else:
                 return {
                     "success": False,
@@ -727,9 +842,9 @@ async def manage_notion_data(
 
         if operation == "archive":
             if entity_type == "page":
-                await page_manager.archive_page(entity_id, **extra_params)
+                await services.pages.archive_page(entity_id, **extra_params)
             else:
-                await notion_client.update_page(entity_id, archived=True)
+                await services.client.update_page(entity_id, archived=True)
             return {
                 "success": True,
                 "message": f"{entity_type.capitalize()} archived ✅",
@@ -738,22 +853,21 @@ async def manage_notion_data(
         return {"success": False, "error": f"Unknown operation: {operation}"}
 
     except Exception as e:
-        logger.error(f"manage_notion_data failed ({operation} {entity_type})", error=str(e))
+        logger.error("manage_notion_data failed", operation=operation, entity_type=entity_type, error=str(e))
         return {"success": False, "error": str(e)}
 
 
 @mcp.tool(annotations=_READ_ONLY)
 async def query_data_source(
-    data_source_id: str = Field(description="Data source ID to query"),
-    filter: dict[str, Any] | None = Field(default=None, description="Query filter"),
-    sorts: list[dict[str, Any]] | None = Field(default=None, description="Sort list"),
-    limit: int = Field(default=50, description="Max results"),
-    cursor: str | None = Field(default=None, description="Pagination cursor"),
+    data_source_id: Annotated[str, Field(description="Data source ID to query")],
+    filter: Annotated[dict[str, Any] | None, Field(description="Query filter")] = None,
+    sorts: Annotated[list[dict[str, Any]] | None, Field(description="Sort list")] = None,
+    limit: Annotated[int, Field(description="Max results")] = 50,
+    cursor: Cursor = None,
 ) -> dict[str, Any]:
     """High-speed exploration of structured data sources with complex filtering."""
     try:
-        initialize_notion_client()
-        results = await db_manager.query_database(
+        results = await _services().dbs.query_database(
             database_id=data_source_id,
             filter=filter,
             sorts=sorts,
@@ -773,24 +887,20 @@ async def query_data_source(
 
 @mcp.tool(annotations=_READ_ONLY)
 async def search_notion_knowledge(
-    query: str = Field(description="Search query (natural language)"),
-    mode: str = Field(
-        default="semantic",
-        description="Search mode: semantic (RAG), keyword (API), hybrid",
-    ),
-    limit: int = Field(default=10, description="Max results"),
+    query: Annotated[str, Field(description="Search query (natural language)")],
+    mode: Annotated[str, Field(description="Search mode: semantic (RAG), keyword (API), hybrid")] = "semantic",
+    limit: Annotated[int, Field(description="Max results")] = 10,
 ) -> dict[str, Any]:
     """Powerful SOTA search leveraging both Notion API and local RAG pipeline."""
     try:
-        initialize_notion_client()
         results = []
 
         if mode in ["semantic", "hybrid"]:
-            rag_results = await rag.semantic_search(query, limit=limit)
+            rag_results = await _rag().semantic_search(query, limit=limit)
             results.extend([{"type": "rag", **r} for r in rag_results])
 
         if mode in ["keyword", "hybrid"] or not results:
-            api_results = await page_manager.search_pages(query, limit=limit)
+            api_results = await _services().pages.search_pages(query, limit=limit)
             results.extend([{"type": "api", **r} for r in api_results])
 
         return {
@@ -805,15 +915,14 @@ async def search_notion_knowledge(
 
 @mcp.tool(annotations=_MUTATING)
 async def sync_rag_index(
-    data_source_ids: list[str] | None = Field(
-        default=None,
-        description="Specific IDs to index. If None, performs workspace scan",
-    ),
-    force_rebuild: bool = Field(default=False, description="Rebuild index from scratch"),
+    data_source_ids: Annotated[
+        list[str] | None, Field(description="Specific IDs to index. If None, performs workspace scan")
+    ] = None,
+    force_rebuild: Annotated[bool, Field(description="Rebuild index from scratch")] = False,
 ) -> dict[str, Any]:
     """Synchronize Notion workspace knowledge to local LanceDB vector store."""
     try:
-        initialize_notion_client()
+        _services()
         # In a real implementation, this would trigger the indexing loop
         # For now, we'll simulate the orchestrator call
         return {
@@ -829,462 +938,399 @@ async def sync_rag_index(
 
 
 @mcp.tool(annotations=_MUTATING)
+@_tool_guard("Failed to create page", "Page creation failed - check your permissions and parent_id", page_title="title")
 async def create_page(
-    title: str = Field(description="Page title (supports German characters: ä, ö, ü, ß)"),
-    content: str = Field(default="", description="Page content in Notion blocks format or plain text"),
-    parent_id: str | None = Field(
-        default=None,
-        description="Parent page/database ID. If not provided, creates in workspace root",
-    ),
-    properties: dict[str, Any] | None = Field(default=None, description="Page properties if parent is a database"),
-    children: list[dict[str, Any]] | None = Field(default=None, description="Child blocks to add to the page"),
+    title: Annotated[str, Field(description="Page title (supports German characters: ä, ö, ü, ß)")],
+    content: Annotated[str, Field(description="Page content in Notion blocks format or plain text")] = "",
+    parent_id: Annotated[
+        str | None, Field(description="Parent page/database ID. If not provided, creates in workspace root")
+    ] = None,
+    properties: Annotated[dict[str, Any] | None, Field(description="Page properties if parent is a database")] = None,
+    children: Annotated[list[dict[str, Any]] | None, Field(description="Child blocks to add to the page")] = None,
 ) -> dict[str, Any]:
     """Create a new Notion page with content, properties, and Austrian efficiency."""
-    try:
-        initialize_notion_client()  # Ensure client is initialized
-        result = await page_manager.create_page(
-            title=title,
-            content=content,
-            parent_id=parent_id,
-            properties=properties,
-            children=children,
-        )
-        logger.info("Page created successfully", page_title=title, page_id=result["id"])
-        return {
-            "success": True,
-            "page_id": result["id"],
-            "url": result.get("url", ""),
-            "title": title,
-            "message": f"Page '{title}' created with Austrian efficiency! ✅",
-        }
-    except Exception as e:
-        logger.error("Failed to create page", page_title=title, error=str(e))
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Page creation failed - check your permissions and parent_id",
-        }
+    result = await _services().pages.create_page(
+        title=title,
+        content=content,
+        parent_id=parent_id,
+        properties=properties,
+        children=children,
+    )
+    logger.info("Page created successfully", page_title=title, page_id=result["id"])
+    return {
+        "success": True,
+        "page_id": result["id"],
+        "url": result.get("url", ""),
+        "title": title,
+        "message": f"Page '{title}' created with Austrian efficiency! ✅",
+    }
 
 
 @mcp.tool(annotations=_MUTATING)
+@_tool_guard("Failed to update page", "Page update failed - check page ID and permissions", page_id="page_id")
 async def update_page(
-    page_id: str = Field(description="Page ID to update"),
-    title: str | None = Field(default=None, description="New page title"),
-    content: str | None = Field(default=None, description="New page content"),
-    properties: dict[str, Any] | None = Field(default=None, description="Updated properties"),
-    archived: bool | None = Field(default=None, description="Archive status"),
+    page_id: Annotated[str, Field(description="Page ID to update")],
+    title: Annotated[str | None, Field(description="New page title")] = None,
+    content: Annotated[str | None, Field(description="New page content")] = None,
+    properties: Annotated[dict[str, Any] | None, Field(description="Updated properties")] = None,
+    archived: ArchiveFlag = None,
 ) -> dict[str, Any]:
     """Update existing Notion page with Austrian efficiency."""
-    try:
-        result = await page_manager.update_page(
-            page_id=page_id,
-            title=title,
-            content=content,
-            properties=properties,
-            archived=archived,
-        )
-        logger.info("Page updated successfully", page_id=page_id)
-        return {
-            "success": True,
-            "page_id": page_id,
-            "updated_fields": [k for k, v in locals().items() if v is not None and k != "page_id"],
-            "message": "Page updated with Austrian efficiency! ✅",
-        }
-    except Exception as e:
-        logger.error("Failed to update page", page_id=page_id, error=str(e))
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Page update failed - check page ID and permissions",
-        }
+    await _services().pages.update_page(
+        page_id=page_id,
+        title=title,
+        content=content,
+        properties=properties,
+        archived=archived,
+    )
+    logger.info("Page updated successfully", page_id=page_id)
+    return {
+        "success": True,
+        "page_id": page_id,
+        "updated_fields": [
+            name
+            for name, value in (
+                ("title", title),
+                ("content", content),
+                ("properties", properties),
+                ("archived", archived),
+            )
+            if value is not None
+        ],
+        "message": "Page updated with Austrian efficiency! ✅",
+    }
 
 
 @mcp.tool(annotations=_READ_ONLY)
+@_tool_guard("Failed to get page content", "Page retrieval failed - check page ID and permissions", page_id="page_id")
 async def get_page_content(
-    page_id: str = Field(description="Page ID to retrieve"),
-    include_children: bool = Field(default=True, description="Include child blocks"),
-    block_depth: int = Field(default=10, description="Maximum depth for nested blocks"),
+    page_id: Annotated[str, Field(description="Page ID to retrieve")],
+    include_children: Annotated[bool, Field(description="Include child blocks")] = True,
+    block_depth: Annotated[int, Field(description="Maximum depth for nested blocks")] = 10,
 ) -> dict[str, Any]:
     """Retrieve complete page content with Austrian efficiency optimization."""
-    try:
-        result = await page_manager.get_page_content(
-            page_id=page_id, include_children=include_children, block_depth=block_depth
-        )
-        logger.info("Page content retrieved", page_id=page_id)
-        return {
-            "success": True,
-            "page": result,
-            "message": "Page content retrieved with Austrian efficiency! ✅",
-        }
-    except Exception as e:
-        logger.error("Failed to get page content", page_id=page_id, error=str(e))
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Page retrieval failed - check page ID and permissions",
-        }
+    result = await _services().pages.get_page_content(
+        page_id=page_id, include_children=include_children, block_depth=block_depth
+    )
+    logger.info("Page content retrieved", page_id=page_id)
+    return {
+        "success": True,
+        "page": result,
+        "message": "Page content retrieved with Austrian efficiency! ✅",
+    }
 
 
 @mcp.tool(annotations=_READ_ONLY)
+@_tool_guard("Search failed", "Search failed - check your query and try again", query="query")
 async def search_pages(
-    query: str = Field(description="Search query (natural language)"),
-    filter_by_type: str | None = Field(default=None, description="Filter by object type: page, database"),
-    sort_by: str = Field(
-        default="last_edited_time",
-        description="Sort field: last_edited_time, created_time",
-    ),
-    limit: int = Field(default=10, description="Maximum results to return"),
+    query: Annotated[str, Field(description="Search query (natural language)")],
+    filter_by_type: Annotated[str | None, Field(description="Filter by object type: page, database")] = None,
+    sort_by: Annotated[str, Field(description="Sort field: last_edited_time, created_time")] = "last_edited_time",
+    limit: Annotated[int, Field(description="Maximum results to return")] = 10,
 ) -> dict[str, Any]:
     """Natural language search across entire Notion workspace."""
-    try:
-        results = await page_manager.search_pages(
-            query=query, filter_by_type=filter_by_type, sort_by=sort_by, limit=limit
-        )
-        logger.info(f"Search completed for query: {query}")
-        return {
-            "success": True,
-            "results": results,
-            "count": len(results),
-            "query": query,
-            "message": f"Found {len(results)} results with Austrian efficiency! 🔍",
-        }
-    except Exception as e:
-        logger.error(f"Search failed for query '{query}': {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Search failed - check your query and try again",
-        }
+    results = await _services().pages.search_pages(
+        query=query, filter_by_type=filter_by_type, sort_by=sort_by, limit=limit
+    )
+    logger.info("Search completed", query=query, result_count=len(results))
+    return {
+        "success": True,
+        "results": results,
+        "count": len(results),
+        "query": query,
+        "message": f"Found {len(results)} results with Austrian efficiency! 🔍",
+    }
 
 
 @mcp.tool(annotations=_DESTRUCTIVE)
+@_tool_guard("Failed to archive page", "Archive operation failed - check page ID and permissions", page_id="page_id")
 async def archive_page(
-    page_id: str = Field(description="Page ID to archive"),
-    permanent_delete: bool = Field(default=False, description="Permanently delete instead of archive"),
-    backup_first: bool = Field(default=True, description="Create backup before deletion"),
+    page_id: Annotated[str, Field(description="Page ID to archive")],
+    permanent_delete: Annotated[bool, Field(description="Permanently delete instead of archive")] = False,
+    backup_first: Annotated[bool, Field(description="Create backup before deletion")] = True,
 ) -> dict[str, Any]:
     """Safely archive or delete pages with Austrian efficiency confirmations."""
-    try:
-        await page_manager.archive_page(
-            page_id=page_id,
-            permanent_delete=permanent_delete,
-            backup_first=backup_first,
-        )
-        action = "deleted" if permanent_delete else "archived"
-        logger.info(
-            "Page archived/deleted",
-            page_id=page_id,
-            action=action,
-            backup_created=backup_first,
-        )
-        return {
-            "success": True,
-            "page_id": page_id,
-            "action": action,
-            "backup_created": backup_first,
-            "message": f"Page {action} with Austrian efficiency! ✅",
-        }
-    except Exception as e:
-        logger.error("Failed to archive page", page_id=page_id, error=str(e))
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Archive operation failed - check page ID and permissions",
-        }
+    await _services().pages.archive_page(
+        page_id=page_id,
+        permanent_delete=permanent_delete,
+        backup_first=backup_first,
+    )
+    action = "deleted" if permanent_delete else "archived"
+    logger.info(
+        "Page archived/deleted",
+        page_id=page_id,
+        action=action,
+        backup_created=backup_first,
+    )
+    return {
+        "success": True,
+        "page_id": page_id,
+        "action": action,
+        "backup_created": backup_first,
+        "message": f"Page {action} with Austrian efficiency! ✅",
+    }
 
 
 # 🗄️ Database Operations (6 tools)
 
 
 @mcp.tool(annotations=_MUTATING)
+@_tool_guard(
+    "Failed to create database",
+    "Database creation failed - check schema and permissions",
+    database_title="title",
+)
 async def create_database(
-    title: str = Field(description="Database title"),
-    parent_id: str = Field(description="Parent page ID where database will be created"),
-    properties_schema: dict[str, Any] = Field(description="Database properties schema"),
-    icon: str | None = Field(default=None, description="Database icon (emoji or external URL)"),
-    cover: str | None = Field(default=None, description="Database cover image URL"),
+    title: Annotated[str, Field(description="Database title")],
+    parent_id: Annotated[str, Field(description="Parent page ID where database will be created")],
+    properties_schema: Annotated[dict[str, Any], Field(description="Database properties schema")],
+    icon: Annotated[str | None, Field(description="Database icon (emoji or external URL)")] = None,
+    cover: Annotated[str | None, Field(description="Database cover image URL")] = None,
 ) -> dict[str, Any]:
     """Create databases with custom property schemas."""
-    try:
-        result = await db_manager.create_database(
-            title=title,
-            parent_id=parent_id,
-            properties_schema=properties_schema,
-            icon=icon,
-            cover=cover,
-        )
-        logger.info(f"Database created: {title}")
-        return {
-            "success": True,
-            "database_id": result["id"],
-            "url": result.get("url", ""),
-            "title": title,
-            "properties": result.get("properties", {}),
-            "message": f"Database '{title}' created with Austrian efficiency! 🗄️",
-        }
-    except Exception as e:
-        logger.error(f"Failed to create database '{title}': {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Database creation failed - check schema and permissions",
-        }
+    result = await _services().dbs.create_database(
+        title=title,
+        parent_id=parent_id,
+        properties_schema=properties_schema,
+        icon=icon,
+        cover=cover,
+    )
+    logger.info("Database created", database_title=title, database_id=result["id"])
+    return {
+        "success": True,
+        "database_id": result["id"],
+        "url": result.get("url", ""),
+        "title": title,
+        "properties": result.get("properties", {}),
+        "message": f"Database '{title}' created with Austrian efficiency! 🗄️",
+    }
 
 
 @mcp.tool(annotations=_READ_ONLY)
+@_tool_guard(
+    "Database query failed",
+    "Database query failed - check database ID and filter syntax",
+    database_id="database_id",
+)
 async def query_database(
-    database_id: str = Field(description="Database ID to query"),
-    filter: dict[str, Any] | None = Field(default=None, description="Query filter conditions"),
-    sorts: list[dict[str, Any]] | None = Field(default=None, description="Sort configuration"),
-    limit: int = Field(default=100, description="Maximum results"),
-    cursor: str | None = Field(default=None, description="Pagination cursor"),
+    database_id: Annotated[str, Field(description="Database ID to query")],
+    filter: Annotated[dict[str, Any] | None, Field(description="Query filter conditions")] = None,
+    sorts: Annotated[list[dict[str, Any]] | None, Field(description="Sort configuration")] = None,
+    limit: Annotated[int, Field(description="Maximum results")] = 100,
+    cursor: Cursor = None,
 ) -> dict[str, Any]:
     """Query databases with complex filters and sorts."""
-    try:
-        results = await db_manager.query_database(
-            database_id=database_id,
-            filter=filter,
-            sorts=sorts,
-            limit=limit,
-            cursor=cursor,
-        )
-        result_count = len(results.get("results", []))
-        logger.info(
-            "Database query completed",
-            database_id=database_id,
-            result_count=result_count,
-        )
-        return {
-            "success": True,
-            "results": results.get("results", []),
-            "has_more": results.get("has_more", False),
-            "next_cursor": results.get("next_cursor"),
-            "count": result_count,
-            "message": "Query completed with Austrian efficiency! 🔍",
-        }
-    except Exception as e:
-        logger.error("Database query failed", database_id=database_id, error=str(e))
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Database query failed - check database ID and filter syntax",
-        }
+    results = await _services().dbs.query_database(
+        database_id=database_id,
+        filter=filter,
+        sorts=sorts,
+        limit=limit,
+        cursor=cursor,
+    )
+    result_count = len(results.get("results", []))
+    logger.info(
+        "Database query completed",
+        database_id=database_id,
+        result_count=result_count,
+    )
+    return {
+        "success": True,
+        "results": results.get("results", []),
+        "has_more": results.get("has_more", False),
+        "next_cursor": results.get("next_cursor"),
+        "count": result_count,
+        "message": "Query completed with Austrian efficiency! 🔍",
+    }
 
 
 @mcp.tool(annotations=_MUTATING)
+@_tool_guard(
+    "Failed to create database entry",
+    "Database entry creation failed - check properties and schema",
+    database_id="database_id",
+)
 async def create_database_entry(
-    database_id: str = Field(description="Database ID to add entry to"),
-    properties: dict[str, Any] = Field(description="Entry properties"),
-    content: str = Field(default="", description="Entry content"),
-    children: list[dict[str, Any]] | None = Field(default=None, description="Child blocks"),
+    database_id: Annotated[str, Field(description="Database ID to add entry to")],
+    properties: Annotated[dict[str, Any], Field(description="Entry properties")],
+    content: Annotated[str, Field(description="Entry content")] = "",
+    children: Annotated[list[dict[str, Any]] | None, Field(description="Child blocks")] = None,
 ) -> dict[str, Any]:
     """Add entries with all property types (text, select, date, etc.)"""
-    try:
-        result = await db_manager.create_database_entry(
-            database_id=database_id,
-            properties=properties,
-            content=content,
-            children=children,
-        )
-        logger.info(f"Database entry created: {database_id}")
-        return {
-            "success": True,
-            "page_id": result["id"],
-            "database_id": database_id,
-            "properties": properties,
-            "message": "Database entry created with Austrian efficiency! ✅",
-        }
-    except Exception as e:
-        logger.error(f"Failed to create database entry: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Database entry creation failed - check properties and schema",
-        }
+    result = await _services().dbs.create_database_entry(
+        database_id=database_id,
+        properties=properties,
+        content=content,
+        children=children,
+    )
+    logger.info("Database entry created", database_id=database_id, page_id=result["id"])
+    return {
+        "success": True,
+        "page_id": result["id"],
+        "database_id": database_id,
+        "properties": properties,
+        "message": "Database entry created with Austrian efficiency! ✅",
+    }
 
 
 @mcp.tool(annotations=_MUTATING)
+@_tool_guard(
+    "Failed to update database entry",
+    "Database entry update failed - check page ID and properties",
+    page_id="page_id",
+)
 async def update_database_entry(
-    page_id: str = Field(description="Entry page ID to update"),
-    properties: dict[str, Any] | None = Field(default=None, description="Updated properties"),
-    content: str | None = Field(default=None, description="Updated content"),
-    archived: bool | None = Field(default=None, description="Archive status"),
+    page_id: Annotated[str, Field(description="Entry page ID to update")],
+    properties: Annotated[dict[str, Any] | None, Field(description="Updated properties")] = None,
+    content: Annotated[str | None, Field(description="Updated content")] = None,
+    archived: ArchiveFlag = None,
 ) -> dict[str, Any]:
     """Update existing database entries and properties."""
-    try:
-        await db_manager.update_database_entry(
-            page_id=page_id, properties=properties, content=content, archived=archived
-        )
-        logger.info("Database entry updated", page_id=page_id)
-        return {
-            "success": True,
-            "page_id": page_id,
-            "updated_properties": properties,
-            "message": "Database entry updated with Austrian efficiency! ✅",
-        }
-    except Exception as e:
-        logger.error("Failed to update database entry", page_id=page_id, error=str(e))
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Database entry update failed - check page ID and properties",
-        }
+    await _services().dbs.update_database_entry(
+        page_id=page_id, properties=properties, content=content, archived=archived
+    )
+    logger.info("Database entry updated", page_id=page_id)
+    return {
+        "success": True,
+        "page_id": page_id,
+        "updated_properties": properties,
+        "message": "Database entry updated with Austrian efficiency! ✅",
+    }
 
 
 @mcp.tool(annotations=_READ_ONLY)
+@_tool_guard(
+    "Failed to get database schema",
+    "Schema retrieval failed - check database ID and permissions",
+    database_id="database_id",
+)
 async def get_database_schema(
-    database_id: str = Field(description="Database ID to analyze"),
-    include_statistics: bool = Field(default=False, description="Include usage statistics"),
-    property_details: bool = Field(default=True, description="Include detailed property information"),
+    database_id: Annotated[str, Field(description="Database ID to analyze")],
+    include_statistics: Annotated[bool, Field(description="Include usage statistics")] = False,
+    property_details: Annotated[bool, Field(description="Include detailed property information")] = True,
 ) -> dict[str, Any]:
     """Retrieve database structure, properties, and metadata."""
-    try:
-        result = await db_manager.get_database_schema(
-            database_id=database_id,
-            include_statistics=include_statistics,
-            property_details=property_details,
-        )
-        logger.info(f"Database schema retrieved: {database_id}")
-        return {
-            "success": True,
-            "schema": result,
-            "message": "Database schema retrieved with Austrian efficiency! 📊",
-        }
-    except Exception as e:
-        logger.error(f"Failed to get database schema {database_id}: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Schema retrieval failed - check database ID and permissions",
-        }
+    result = await _services().dbs.get_database_schema(
+        database_id=database_id,
+        include_statistics=include_statistics,
+        property_details=property_details,
+    )
+    logger.info("Database schema retrieved", database_id=database_id)
+    return {
+        "success": True,
+        "schema": result,
+        "message": "Database schema retrieved with Austrian efficiency! 📊",
+    }
 
 
 @mcp.tool(annotations=_MUTATING)
+@_tool_guard(
+    "Bulk import failed",
+    "Bulk import failed - check data format and database schema",
+    database_id="database_id",
+)
 async def bulk_import_data(
-    database_id: str = Field(description="Target database ID"),
-    data_source: str = Field(description="CSV or JSON data to import"),
-    mapping: dict[str, str] | None = Field(default=None, description="Field mapping (source -> target)"),
-    merge_strategy: str = Field(default="create_new", description="How to handle existing data"),
+    database_id: Annotated[str, Field(description="Target database ID")],
+    data_source: Annotated[str | None, Field(description="CSV or JSON data to import")] = None,
+    mapping: Annotated[dict[str, str] | None, Field(description="Field mapping (source -> target)")] = None,
+    merge_strategy: Annotated[str, Field(description="How to handle existing data")] = "create_new",
+    file_name: Annotated[
+        str | None,
+        Field(description="Name of a .csv/.json file in the import directory, instead of inline data_source"),
+    ] = None,
 ) -> dict[str, Any]:
     """Import CSV/JSON data efficiently into databases."""
-    try:
-        result = await db_manager.bulk_import_data(
-            database_id=database_id,
-            data_source=data_source,
-            mapping=mapping,
-            merge_strategy=merge_strategy,
-        )
-        logger.info(
-            "Bulk import completed",
-            database_id=database_id,
-            successful=result.get("successful_imports", 0),
-            total=result.get("total_records", 0),
-        )
-        return {
-            "success": True,
-            "import_results": result,
-            "message": f"Imported {result['successful_imports']}/{result['total_records']} records.",
-        }
-    except Exception as e:
-        logger.error("Bulk import failed", database_id=database_id, error=str(e))
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Bulk import failed - check data format and database schema",
-        }
+    if (data_source is None) == (file_name is None):
+        raise ValueError("Provide exactly one of data_source or file_name")
+
+    result = await _services().dbs.bulk_import_data(
+        database_id=database_id,
+        data_source=data_source if file_name is None else _import_file(file_name),
+        mapping=mapping,
+        merge_strategy=merge_strategy,
+    )
+    logger.info(
+        "Bulk import completed",
+        database_id=database_id,
+        successful=result.get("successful_imports", 0),
+        total=result.get("total_records", 0),
+    )
+    return {
+        "success": True,
+        "import_results": result,
+        "message": f"Imported {result['successful_imports']}/{result['total_records']} records.",
+    }
 
 
 # 💬 Collaboration Tools (3 tools)
 
 
 @mcp.tool(annotations=_MUTATING)
+@_tool_guard("Failed to add comment", "Comment creation failed - check page ID and permissions", page_id="page_id")
 async def add_comment(
-    page_id: str = Field(description="Page or block ID to comment on"),
-    content: str = Field(description="Comment content"),
-    parent_comment_id: str | None = Field(default=None, description="Parent comment for threaded discussions"),
-    rich_text: list[dict[str, Any]] | None = Field(default=None, description="Rich text formatting"),
+    page_id: Annotated[str, Field(description="Page or block ID to comment on")],
+    content: Annotated[str, Field(description="Comment content")],
+    parent_comment_id: Annotated[str | None, Field(description="Parent comment for threaded discussions")] = None,
+    rich_text: Annotated[list[dict[str, Any]] | None, Field(description="Rich text formatting")] = None,
 ) -> dict[str, Any]:
     """Add comments to pages or specific blocks."""
-    try:
-        result = await collab_manager.add_comment(
-            page_id=page_id,
-            content=content,
-            parent_comment_id=parent_comment_id,
-            rich_text=rich_text,
-        )
-        logger.info("Comment added", page_id=page_id, comment_id=result.get("id"))
-        return {
-            "success": True,
-            "comment": result,
-            "message": "Comment added with Austrian efficiency! 💬",
-        }
-    except Exception as e:
-        logger.error("Failed to add comment", page_id=page_id, error=str(e))
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Comment creation failed - check page ID and permissions",
-        }
+    result = await _services().collab.add_comment(
+        page_id=page_id,
+        content=content,
+        parent_comment_id=parent_comment_id,
+        rich_text=rich_text,
+    )
+    logger.info("Comment added", page_id=page_id, comment_id=result.get("id"))
+    return {
+        "success": True,
+        "comment": result,
+        "message": "Comment added with Austrian efficiency! 💬",
+    }
 
 
 @mcp.tool(annotations=_READ_ONLY)
+@_tool_guard("Failed to get comments", "Comment retrieval failed - check page ID and permissions", page_id="page_id")
 async def get_comments(
-    page_id: str = Field(description="Page ID to get comments from"),
-    include_resolved: bool = Field(default=False, description="Include resolved comments"),
-    sort_by: str = Field(default="created_time", description="Sort field"),
-    limit: int = Field(default=50, description="Maximum comments to return"),
+    page_id: Annotated[str, Field(description="Page ID to get comments from")],
+    include_resolved: Annotated[bool, Field(description="Include resolved comments")] = False,
+    sort_by: Annotated[str, Field(description="Sort field")] = "created_time",
+    limit: Annotated[int, Field(description="Maximum comments to return")] = 50,
 ) -> dict[str, Any]:
     """Retrieve page/block discussions and comment threads."""
-    try:
-        results = await collab_manager.get_comments(
-            page_id=page_id,
-            include_resolved=include_resolved,
-            sort_by=sort_by,
-            limit=limit,
-        )
-        logger.info("Comments retrieved", page_id=page_id, comment_count=len(results))
-        return {
-            "success": True,
-            "comments": results,
-            "count": len(results),
-            "message": f"Retrieved {len(results)} comments with Austrian efficiency! 💬",
-        }
-    except Exception as e:
-        logger.error("Failed to get comments", page_id=page_id, error=str(e))
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Comment retrieval failed - check page ID and permissions",
-        }
+    results = await _services().collab.get_comments(
+        page_id=page_id,
+        include_resolved=include_resolved,
+        sort_by=sort_by,
+        limit=limit,
+    )
+    logger.info("Comments retrieved", page_id=page_id, comment_count=len(results))
+    return {
+        "success": True,
+        "comments": results,
+        "count": len(results),
+        "message": f"Retrieved {len(results)} comments with Austrian efficiency! 💬",
+    }
 
 
 @mcp.tool(annotations=_READ_ONLY)
+@_tool_guard("Failed to get workspace users", "User retrieval failed - check permissions")
 async def get_workspace_users(
-    include_inactive: bool = Field(default=False, description="Include inactive users"),
-    permission_level: str | None = Field(default=None, description="Filter by permission level"),
-    sort_by: str = Field(default="name", description="Sort field"),
+    include_inactive: Annotated[bool, Field(description="Include inactive users")] = False,
+    permission_level: Annotated[str | None, Field(description="Filter by permission level")] = None,
+    sort_by: Annotated[str, Field(description="Sort field")] = "name",
 ) -> dict[str, Any]:
     """List workspace users, permissions, and activity."""
-    try:
-        results = await collab_manager.get_workspace_users(
-            include_inactive=include_inactive,
-            permission_level=permission_level,
-            sort_by=sort_by,
-        )
-        logger.info("Workspace users retrieved", user_count=len(results))
-        return {
-            "success": True,
-            "users": results,
-            "count": len(results),
-            "message": f"Retrieved {len(results)} users with Austrian efficiency! 👥",
-        }
-    except Exception as e:
-        logger.error("Failed to get workspace users", error=str(e))
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "User retrieval failed - check permissions",
-        }
+    results = await _services().collab.get_workspace_users(
+        include_inactive=include_inactive,
+        permission_level=permission_level,
+        sort_by=sort_by,
+    )
+    logger.info("Workspace users retrieved", user_count=len(results))
+    return {
+        "success": True,
+        "users": results,
+        "count": len(results),
+        "message": f"Retrieved {len(results)} users with Austrian efficiency! 👥",
+    }
 
 
 # 🔍 Advanced Features (7 tools)
@@ -1292,14 +1338,13 @@ async def get_workspace_users(
 
 @mcp.tool(annotations=_MUTATING)
 async def setup_automation(
-    trigger_type: str = Field(description="Automation trigger type"),
-    conditions: dict[str, Any] = Field(description="Trigger conditions"),
-    actions: list[dict[str, Any]] = Field(description="Actions to perform"),
-    webhook_url: str | None = Field(default=None, description="Optional webhook URL"),
+    trigger_type: Annotated[str, Field(description="Automation trigger type")],
+    conditions: Annotated[dict[str, Any], Field(description="Trigger conditions")],
+    actions: Annotated[list[dict[str, Any]], Field(description="Actions to perform")],
+    webhook_url: Annotated[str | None, Field(description="Optional webhook URL")] = None,
 ) -> dict[str, Any]:
     """Configure a Notion automation with webhook integration."""
-    initialize_notion_client()
-    return await automation_manager.setup_automation(
+    return await _services().auto.setup_automation(
         trigger_type=trigger_type,
         conditions=conditions,
         actions=actions,
@@ -1309,13 +1354,12 @@ async def setup_automation(
 
 @mcp.tool(annotations=_MUTATING)
 async def sync_external_data(
-    external_source: str = Field(description="External data source type"),
-    sync_config: dict[str, Any] = Field(description="Sync configuration"),
-    update_frequency: str = Field(default="daily", description="Update frequency"),
+    external_source: Annotated[str, Field(description="External data source type")],
+    sync_config: Annotated[dict[str, Any], Field(description="Sync configuration")],
+    update_frequency: Annotated[str, Field(description="Update frequency")] = "daily",
 ) -> dict[str, Any]:
     """Create synced databases from external tools."""
-    initialize_notion_client()
-    return await automation_manager.sync_external_data(
+    return await _services().auto.sync_external_data(
         external_source=external_source,
         sync_config=sync_config,
         update_frequency=update_frequency,
@@ -1324,14 +1368,13 @@ async def sync_external_data(
 
 @mcp.tool(annotations=_MUTATING)
 async def generate_ai_summary(
-    page_id: str = Field(description="Page ID to analyze"),
-    summary_type: str = Field(default="comprehensive", description="Summary type"),
-    length: str = Field(default="medium", description="Summary length"),
-    focus_areas: list[str] | None = Field(default=None, description="Areas to focus on"),
+    page_id: Annotated[str, Field(description="Page ID to analyze")],
+    summary_type: Annotated[str, Field(description="Summary type")] = "comprehensive",
+    length: Annotated[str, Field(description="Summary length")] = "medium",
+    focus_areas: Annotated[list[str] | None, Field(description="Areas to focus on")] = None,
 ) -> dict[str, Any]:
     """Summarize page content using LLM API or fallback."""
-    initialize_notion_client()
-    return await automation_manager.generate_ai_summary(
+    return await _services().auto.generate_ai_summary(
         page_id=page_id,
         summary_type=summary_type,
         length=length,
@@ -1341,27 +1384,25 @@ async def generate_ai_summary(
 
 @mcp.tool(annotations=_MUTATING)
 async def export_workspace_data(
-    scope: str = Field(default="workspace", description="Export scope"),
-    format: str = Field(default="json", description="Export format"),
-    include_metadata: bool = Field(default=True, description="Include metadata"),
-    compression: bool = Field(default=True, description="Compress export"),
+    scope: Annotated[str, Field(description="Export scope")] = "workspace",
+    format: Annotated[str, Field(description="Export format")] = "json",
+    include_metadata: Annotated[bool, Field(description="Include metadata")] = True,
+    compression: Annotated[bool, Field(description="Compress export")] = True,
 ) -> dict[str, Any]:
     """Backup and export functionality with multiple formats."""
-    initialize_notion_client()
-    return await automation_manager.export_workspace_data(
+    return await _services().auto.export_workspace_data(
         scope=scope, format=format, include_metadata=include_metadata, compression=compression
     )
 
 
 @mcp.tool(annotations=_MUTATING)
 async def import_workspace_data(
-    source_path: str = Field(description="Local path to Markdown/JSON file"),
-    target_parent_id: str = Field(description="Parent Page/Database ID in Notion"),
-    import_type: str = Field(default="markdown", description="Type of data: markdown or json"),
+    source_path: Annotated[str, Field(description="Local path to Markdown/JSON file")],
+    target_parent_id: Annotated[str, Field(description="Parent Page/Database ID in Notion")],
+    import_type: Annotated[str, Field(description="Type of data: markdown or json")] = "markdown",
 ) -> dict[str, Any]:
     """Import external data into Notion workspace."""
-    initialize_notion_client()
-    return await automation_manager.import_workspace_data(
+    return await _services().auto.import_workspace_data(
         source_file=source_path,
         target_parent_id=target_parent_id,
         import_type=import_type,
@@ -1370,16 +1411,16 @@ async def import_workspace_data(
 
 @mcp.tool(annotations=_MUTATING)
 async def orchestrate_automation(
-    operation: str = Field(description="Automation operation: setup, sync_external, report, export"),
-    config: dict[str, Any] = Field(description="Automation configuration"),
+    operation: Annotated[str, Field(description="Automation operation: setup, sync_external, report, export")],
+    config: Annotated[dict[str, Any], Field(description="Automation configuration")],
 ) -> dict[str, Any]:
     """SOTA Orchestrator for Notion automations, bulk syncing, and reporting."""
-    initialize_notion_client()
+    services = _services()
     ops = {
-        "setup": automation_manager.setup_automation,
-        "sync_external": automation_manager.sync_external_data,
-        "report": automation_manager.generate_ai_summary,
-        "export": automation_manager.export_workspace_data,
+        "setup": services.auto.setup_automation,
+        "sync_external": services.auto.sync_external_data,
+        "report": services.auto.generate_ai_summary,
+        "export": services.auto.export_workspace_data,
     }
     handler = ops.get(operation)
     if not handler:
@@ -1392,21 +1433,19 @@ async def orchestrate_automation(
 
 @mcp.tool(annotations=_MUTATING)
 async def verify_webhook(
-    verification_token: str = Field(description="Verification token from Notion's webhook POST"),
+    verification_token: Annotated[str, Field(description="Verification token from Notion's webhook POST")],
 ) -> dict[str, Any]:
     """Store a webhook verification token from Notion."""
-    initialize_notion_client()
-    return await automation_manager.verify_webhook_subscription(verification_token)
+    return await _services().auto.verify_webhook_subscription(verification_token)
 
 
 @mcp.tool(annotations=_READ_ONLY)
 async def list_webhook_events(
-    limit: int = Field(default=50, description="Max events to return"),
-    event_type: str | None = Field(default=None, description="Filter by event type"),
+    limit: Annotated[int, Field(description="Max events to return")] = 50,
+    event_type: Annotated[str | None, Field(description="Filter by event type")] = None,
 ) -> dict[str, Any]:
     """List received Notion webhook events."""
-    initialize_notion_client()
-    events = await automation_manager.list_webhook_events(limit=limit, event_type=event_type)
+    events = await _services().auto.list_webhook_events(limit=limit, event_type=event_type)
     return {"success": True, "events": events, "count": len(events)}
 
 
@@ -1415,7 +1454,7 @@ async def list_webhook_events(
 
 @mcp.tool(annotations=_MUTATING)
 async def deploy_worker(
-    project_dir: str | None = Field(default=None, description="Worker project directory (default: current dir)"),
+    project_dir: Annotated[str | None, Field(description="Worker project directory (default: current dir)")] = None,
 ) -> dict[str, Any]:
     """Deploy a Notion Worker. Requires ntn CLI installed."""
     return await notion_workers.deploy_worker(project_dir)
@@ -1429,7 +1468,7 @@ async def list_workers() -> dict[str, Any]:
 
 @mcp.tool(annotations=_MUTATING)
 async def scaffold_worker(
-    project_dir: str = Field(description="Directory to scaffold the worker project"),
+    project_dir: Annotated[str, Field(description="Directory to scaffold the worker project")],
 ) -> dict[str, Any]:
     """Scaffold a new Notion Worker project. Requires ntn CLI."""
     return await notion_workers.scaffold_worker(project_dir)
@@ -1437,8 +1476,8 @@ async def scaffold_worker(
 
 @mcp.tool(annotations=_READ_ONLY)
 async def worker_logs(
-    worker_name: str | None = Field(default=None, description="Worker name filter"),
-    tail: int = Field(default=50, description="Number of log lines"),
+    worker_name: Annotated[str | None, Field(description="Worker name filter")] = None,
+    tail: Annotated[int, Field(description="Number of log lines")] = 50,
 ) -> dict[str, Any]:
     """Fetch logs from a deployed Notion Worker."""
     return await notion_workers.worker_logs(worker_name=worker_name, tail=tail)
@@ -1452,10 +1491,10 @@ async def check_ntn() -> dict[str, Any]:
 
 @mcp.tool(annotations=_MUTATING)
 async def orchestrate_workers(
-    operation: str = Field(description="Worker operation: deploy, list, scaffold, logs, check"),
-    project_dir: str | None = Field(default=None, description="Project directory (for deploy/scaffold)"),
-    worker_name: str | None = Field(default=None, description="Worker name (for logs)"),
-    tail: int = Field(default=50, description="Log lines (for logs)"),
+    operation: Annotated[str, Field(description="Worker operation: deploy, list, scaffold, logs, check")],
+    project_dir: Annotated[str | None, Field(description="Project directory (for deploy/scaffold)")] = None,
+    worker_name: Annotated[str | None, Field(description="Worker name (for logs)")] = None,
+    tail: Annotated[int, Field(description="Log lines (for logs)")] = 50,
 ) -> dict[str, Any]:
     """Orchestrate Notion Workers operations."""
     ops = {
@@ -1476,13 +1515,12 @@ async def orchestrate_workers(
 
 @mcp.tool(annotations=_MUTATING)
 async def append_blocks(
-    block_id: str = Field(description="Page or block ID to append children to"),
-    children: list[dict[str, Any]] = Field(description="List of block objects to append"),
+    block_id: Annotated[str, Field(description="Page or block ID to append children to")],
+    children: Annotated[list[dict[str, Any]], Field(description="List of block objects to append")],
 ) -> dict[str, Any]:
     """Append child blocks to an existing page or block."""
     try:
-        initialize_notion_client()
-        result = await notion_client.append_block_children(block_id, children)
+        result = await _services().client.append_block_children(block_id, children)
         return {"success": True, "result": result, "message": f"Appended {len(children)} blocks."}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1490,18 +1528,17 @@ async def append_blocks(
 
 @mcp.tool(annotations=_MUTATING)
 async def update_block(
-    block_id: str = Field(description="Block ID to update"),
-    block_type: str = Field(description="Block type (e.g. paragraph, heading_1, to_do)"),
-    content: dict[str, Any] = Field(description="Block content properties (e.g. rich_text, checked)"),
-    archived: bool | None = Field(default=None, description="Archive or unarchive the block"),
+    block_id: Annotated[str, Field(description="Block ID to update")],
+    block_type: Annotated[str, Field(description="Block type (e.g. paragraph, heading_1, to_do)")],
+    content: Annotated[dict[str, Any], Field(description="Block content properties (e.g. rich_text, checked)")],
+    archived: Annotated[bool | None, Field(description="Archive or unarchive the block")] = None,
 ) -> dict[str, Any]:
     """Update a specific block's content or properties."""
     try:
-        initialize_notion_client()
         kwargs: dict[str, Any] = {block_type: content}
         if archived is not None:
             kwargs["archived"] = archived
-        result = await notion_client.update_block(block_id, **kwargs)
+        result = await _services().client.update_block(block_id, **kwargs)
         return {"success": True, "result": result, "message": "Block updated."}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1509,12 +1546,11 @@ async def update_block(
 
 @mcp.tool(annotations=_DESTRUCTIVE)
 async def delete_block(
-    block_id: str = Field(description="Block ID to archive/delete"),
+    block_id: Annotated[str, Field(description="Block ID to archive/delete")],
 ) -> dict[str, Any]:
     """Archive (soft-delete) a block by ID."""
     try:
-        initialize_notion_client()
-        result = await notion_client.delete_block(block_id)
+        result = await _services().client.delete_block(block_id)
         return {"success": True, "result": result, "message": "Block archived."}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1525,12 +1561,11 @@ async def delete_block(
 
 @mcp.tool(annotations=_READ_ONLY)
 async def get_page_markdown(
-    page_id: str = Field(description="Page ID to retrieve as markdown"),
+    page_id: Annotated[str, Field(description="Page ID to retrieve as markdown")],
 ) -> dict[str, Any]:
     """Retrieve page content as enhanced markdown (API 2026-03-11)."""
     try:
-        initialize_notion_client()
-        result = await notion_client.retrieve_page_markdown(page_id)
+        result = await _services().client.retrieve_page_markdown(page_id)
         return {"success": True, "markdown": result.get("markdown", ""), "page_id": page_id}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1538,13 +1573,12 @@ async def get_page_markdown(
 
 @mcp.tool(annotations=_MUTATING)
 async def update_page_markdown(
-    page_id: str = Field(description="Page ID to update"),
-    markdown: str = Field(description="Full markdown content to write to the page"),
+    page_id: Annotated[str, Field(description="Page ID to update")],
+    markdown: Annotated[str, Field(description="Full markdown content to write to the page")],
 ) -> dict[str, Any]:
     """Update page content using enhanced markdown (API 2026-03-11)."""
     try:
-        initialize_notion_client()
-        result = await notion_client.update_page_markdown(page_id, markdown)
+        result = await _services().client.update_page_markdown(page_id, markdown)
         return {"success": True, "result": result, "message": "Page updated via markdown."}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1555,14 +1589,15 @@ async def update_page_markdown(
 
 @mcp.tool(annotations=_MUTATING)
 async def update_database_schema(
-    database_id: str = Field(description="Database ID to update"),
-    title: str | None = Field(default=None, description="New database title"),
-    properties: dict[str, Any] | None = Field(default=None, description="Property schema changes (add/remove/modify)"),
-    description: list[dict[str, Any]] | None = Field(default=None, description="Rich text description"),
+    database_id: Annotated[str, Field(description="Database ID to update")],
+    title: Annotated[str | None, Field(description="New database title")] = None,
+    properties: Annotated[
+        dict[str, Any] | None, Field(description="Property schema changes (add/remove/modify)")
+    ] = None,
+    description: Annotated[list[dict[str, Any]] | None, Field(description="Rich text description")] = None,
 ) -> dict[str, Any]:
     """Update database properties, title, or description."""
     try:
-        initialize_notion_client()
         kwargs: dict[str, Any] = {}
         if title:
             kwargs["title"] = [{"type": "text", "text": {"content": title}}]
@@ -1570,7 +1605,7 @@ async def update_database_schema(
             kwargs["properties"] = properties
         if description:
             kwargs["description"] = description
-        result = await notion_client.update_database_schema(database_id, **kwargs)
+        result = await _services().client.update_database_schema(database_id, **kwargs)
         return {"success": True, "result": result, "message": "Database schema updated."}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1583,8 +1618,7 @@ async def update_database_schema(
 async def append_blocks_rest(page_id: str, children: list[dict[str, Any]] = Body(...)):
     """Append child blocks to a page."""
     try:
-        initialize_notion_client()
-        result = await notion_client.append_block_children(page_id, children)
+        result = await _services().client.append_block_children(page_id, children)
         return {"success": True, "result": result}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1594,8 +1628,7 @@ async def append_blocks_rest(page_id: str, children: list[dict[str, Any]] = Body
 async def update_block_rest(page_id: str, block_id: str, data: dict[str, Any] = Body(...)):
     """Update a specific block."""
     try:
-        initialize_notion_client()
-        result = await notion_client.update_block(block_id, **data)
+        result = await _services().client.update_block(block_id, **data)
         return {"success": True, "result": result}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1605,8 +1638,7 @@ async def update_block_rest(page_id: str, block_id: str, data: dict[str, Any] =
 async def delete_block_rest(page_id: str, block_id: str):
     """Archive a block."""
     try:
-        initialize_notion_client()
-        result = await notion_client.delete_block(block_id)
+        result = await _services().client.delete_block(block_id)
         return {"success": True, "result": result}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1616,8 +1648,7 @@ async def delete_block_rest(page_id: str, block_id: str):
 async def get_page_markdown_rest(page_id: str):
     """Retrieve page as markdown."""
     try:
-        initialize_notion_client()
-        result = await notion_client.retrieve_page_markdown(page_id)
+        result = await _services().client.retrieve_page_markdown(page_id)
         return {"success": True, "markdown": result.get("markdown", ""), "page_id": page_id}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1627,8 +1658,7 @@ async def get_page_markdown_rest(page_id: str):
 async def update_page_markdown_rest(page_id: str, markdown: str = Body(..., embed=True)):
     """Update page via markdown."""
     try:
-        initialize_notion_client()
-        result = await notion_client.update_page_markdown(page_id, markdown)
+        result = await _services().client.update_page_markdown(page_id, markdown)
         return {"success": True, "result": result}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1638,8 +1668,7 @@ async def update_page_markdown_rest(page_id: str, markdown: str = Body(..., embe
 async def update_database_schema_rest(database_id: str, data: dict[str, Any] = Body(...)):
     """Update database properties."""
     try:
-        initialize_notion_client()
-        result = await notion_client.update_database_schema(database_id, **data)
+        result = await _services().client.update_database_schema(database_id, **data)
         return {"success": True, "result": result}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1647,6 +1676,51 @@ async def update_database_schema_rest(database_id: str, data: dict[str, Any] = B
 
 # Server health check
 
+# Monitoring can poll test_connection rapidly; reuse the last successful users.me probe for a few seconds.
+# Failures are never cached, so the next poll sees a recovered connection immediately.
+_CONNECTION_PROBE_TTL = 5.0
+_connection_probe: tuple[NotionClient, float, dict[str, Any]] | None = None
+
+
+async def _probe_connection(client: NotionClient) -> dict[str, Any]:
+    """Return the client's connection test; successful probes are memoized per client for _CONNECTION_PROBE_TTL."""
+    global _connection_probe
+    now = time.monotonic()
+    if _connection_probe is not None:
+        cached_client, expires_at, result = _connection_probe
+        if cached_client is client and now < expires_at:
+            return result
+    result = await client.test_connection()
+    _connection_probe = (client, now + _CONNECTION_PROBE_TTL, result) if result.get("success") else None
+    return result
+
+
+@mcp.tool(annotations=_READ_ONLY)
+async def test_connection() -> dict[str, Any]:
+    """Test Notion API connection and server health."""
+    try:
+        client = _services().client
+    except _EXPECTED_ERRORS as e:
+        logger.error("Connection test failed", error=str(e))
+        return _failure(e, "Connection failed - check your token and permissions")
+
+    # Connection probe and stats snapshot are independent; run them together
+    connection, stats = await asyncio.gather(_probe_connection(client), client.get_stats(), return_exceptions=True)
+    if isinstance(connection, BaseException):
+        connection = {"success": False, "error": str(connection)}
+    if isinstance(stats, BaseException):
+        stats = {"error": str(stats)}
+
+    healthy = bool(connection.get("success"))
+    return {
+        "success": healthy,
+        "connection": connection,
+        "server_stats": stats,
+        "message": "NotionMCP server healthy with Austrian efficiency! 🇦🇹"
+        if healthy
+        else "NotionMCP server running but the Notion connection failed",
+    }
+
 
 async def main() -> None:
     """Main entry point for the Notion Workspace MCP server."""
@@ -1669,10 +1743,22 @@ async def main() -> None:
     await run_server_async(mcp, http_app=app, server_name="notion-mcp")
 
 
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's (winloop's on Windows) loop factory when installed; None keeps the default asyncio loop."""
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return None
+    return fast_loop.new_event_loop
+
+
 def run() -> None:
     """Synchronous entry point for compatibility."""
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=_event_loop_factory())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
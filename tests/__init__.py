@@ -4,7 +4,8 @@ Austrian Efficiency Testing for Academic and Weeb Workflows
 
 Test modules:
 - test_api.py: Unit tests with comprehensive mocking
-- integration_tests.py: End-to-end workflow validation with real Notion workspace
+- test_server.py: Checks for server.py helpers that need no Notion client
+- test_integration.py: End-to-end MCP tool runs against a mocked Notion SDK
 
 Author: Sandra (Vienna, Austria) 🇦🇹
 Date: July 22, 2025
@@ -0,0 +1,136 @@
+"""
+NotionMCP - Shared pytest fixtures
+Austrian Efficiency Testing - one mocked Notion SDK per test session
+
+Author: Sandra (Vienna, Austria) 🇦🇹
+"""
+
+import copy
+from datetime import datetime
+from operator import attrgetter
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import pytz
+
+from notion_mcp.client import NotionClient
+
+# Notion SDK endpoints the tests configure; their child mocks are created once up front
+NOTION_SDK_ENDPOINTS = (
+    "pages.create",
+    "pages.update",
+    "pages.retrieve",
+    "databases.create",
+    "databases.retrieve",
+    "databases.query",
+    "comments.create",
+    "comments.list",
+    "users.list",
+    "search",
+    "blocks.children.list",
+)
+
+
+@pytest.fixture(scope="session")
+def shared_notion_client():
+    """Patch the Notion SDK client once per session and yield the shared mock instance.
+
+    Tests configure ``return_value``/``side_effect`` on the methods they need;
+    callers are responsible for resetting the mock between tests.
+    """
+    mock_instance = AsyncMock()
+    attrgetter(*NOTION_SDK_ENDPOINTS)(mock_instance)
+    with patch("notion_mcp.client.AsyncClient", return_value=mock_instance):
+        yield mock_instance
+
+
+@pytest.fixture(scope="session")
+def notion_endpoints(shared_notion_client):
+    """Pre-created endpoint mocks of the shared client, in NOTION_SDK_ENDPOINTS order."""
+    return attrgetter(*NOTION_SDK_ENDPOINTS)(shared_notion_client)
+
+
+# Frozen Vienna timestamp fed to get_vienna_time mocks, and its Austrian DD.MM.YYYY HH:MM rendering
+FIXED_VIENNA_TIME = pytz.timezone("Europe/Vienna").localize(datetime(2025, 7, 22, 18, 30))
+AUSTRIAN_DATE = "22.07.2025 18:30"
+
+# NotionClient methods the manager tests stub; created once on each template's client mock
+MANAGER_CLIENT_METHODS = (
+    "create_page",
+    "update_page",
+    "search",
+    "create_database",
+    "query_database",
+    "append_block_children",
+    "create_comment",
+    "get_users",
+)
+
+
+# Session-wide templates: building the mocks once and shallow-copying them per test
+# keeps fixture setup cheap. Per-test fixtures reset calls and configured results on the shared mock.
+@pytest.fixture(scope="session")
+def _notion_client_template():
+    """Build one NotionClient around a mocked AsyncClient for the whole session."""
+    with patch("notion_mcp.client.AsyncClient", return_value=AsyncMock()):
+        client = NotionClient(token="test_token_12345", version="2022-06-28", timeout=30, timezone_str="Europe/Vienna")
+
+    # Attach the mock for assertions; copies share it
+    client._mock_async_client = client.client
+    return client
+
+
+@pytest.fixture
+def mock_notion_client(_notion_client_template):
+    """Create mocked NotionClient for testing."""
+    client = copy.copy(_notion_client_template)
+    client._mock_async_client.reset_mock(return_value=True, side_effect=True)
+    client.request_count = 0
+    client.error_count = 0
+    return client
+
+
+@pytest.fixture(scope="session")
+def _manager_templates():
+    """Manager templates keyed by class, built on first use and kept for the session.
+
+    Each entry holds the template plus a snapshot of its client mock's attributes and children.
+    """
+    return {}
+
+
+@pytest.fixture
+def make_manager(_manager_templates):
+    """Return a factory that builds a manager around the shared mocked NotionClient.
+
+    Each call shallow-copies the session template for ``manager_cls``. The shared client mock is
+    rolled back to its snapshot, so attributes and stubs a test added are gone, then calls plus
+    the configured results of the MANAGER_CLIENT_METHODS stubs are cleared.
+    """
+
+    def _make(manager_cls):
+        entry = _manager_templates.get(manager_cls)
+        if entry is None:
+            mock_client = AsyncMock()
+            attrgetter(*MANAGER_CLIENT_METHODS)(mock_client)
+            # Vienna time helpers are synchronous on NotionClient and return the same values in every test
+            mock_client.format_austrian_date = Mock(return_value=AUSTRIAN_DATE)
+            mock_client.get_vienna_time = Mock(return_value=FIXED_VIENNA_TIME)
+            entry = _manager_templates[manager_cls] = (
+                manager_cls(mock_client),
+                dict(vars(mock_client)),
+                dict(mock_client._mock_children),
+            )
+
+        template, attrs, children = entry
+        client = template.client
+        vars(client).clear()
+        vars(client).update(attrs)
+        client._mock_children.clear()
+        client._mock_children.update(children)
+        client.reset_mock()
+        for method in attrgetter(*MANAGER_CLIENT_METHODS)(client):
+            method.reset_mock(return_value=True, side_effect=True)
+        return copy.copy(template)
+
+    return _make
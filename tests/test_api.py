@@ -7,40 +7,60 @@ Author: Sandra (Vienna, Austria) 🇦🇹
 Date: July 22, 2025
 """
 
-from datetime import datetime
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
-from notion_mcp.automations import AutomationManager
+from notion_client.errors import APIErrorCode, APIResponseError, RequestTimeoutError
 
 # Import the modules to test
-from notion_mcp.client import NotionClient
+from notion_mcp import pages
+from notion_mcp.automations import AutomationManager
+from notion_mcp.client import NotionAPIError
 from notion_mcp.collaboration import CollaborationManager
 from notion_mcp.databases import DatabaseManager
 from notion_mcp.pages import PageManager
 
+from .conftest import AUSTRIAN_DATE
+
+# Every test here is a mocked, self-contained unit test; select with -m unit
+pytestmark = pytest.mark.unit
+
+_BULK_ROWS = [
+    {"Title": "Attack on Titan", "Rating": 9, "Status": "Completed"},
+    {"Title": "Naruto", "Rating": 8, "Status": "Watching"},
+]
+
+_TEST_USER = {"id": "user_123", "name": "Test User", "type": "person"}
+
+# Notion API errors shared by the error-path tests; side_effect re-raises the same instance
+_ERR_UNAUTHORIZED = APIResponseError(
+    code=APIErrorCode.Unauthorized, status=401, message="Unauthorized", headers=Mock(), raw_body_text=""
+)
+_ERR_NOT_FOUND = APIResponseError(
+    code=APIErrorCode.ObjectNotFound, status=404, message="Object not found", headers=Mock(), raw_body_text=""
+)
+_ERR_RATE_LIMITED = APIResponseError(
+    code=APIErrorCode.RateLimited, status=429, message="Rate limited", headers=Mock(), raw_body_text=""
+)
+
+# PageManager replacement for AutomationManager.generate_ai_summary, which imports it lazily
+_MOCK_PAGE_CONTENT = {
+    "blocks": [
+        {
+            "type": "paragraph",
+            "paragraph": {"rich_text": [{"plain_text": "This is research about machine learning."}]},
+        }
+    ]
+}
+_PAGE_MANAGER_STUB = Mock()
+_PAGE_MANAGER_STUB.return_value.get_page_content = AsyncMock(return_value=_MOCK_PAGE_CONTENT)
+
 
 class TestNotionClient:
     """Test the core Notion API client with Austrian efficiency."""
 
-    @pytest.fixture
-    def mock_notion_client(self):
-        """Create mocked NotionClient for testing."""
-        with patch("notion_mcp.client.AsyncClient") as mock_async_client:
-            # Mock the async client instance
-            mock_instance = AsyncMock()
-            mock_async_client.return_value = mock_instance
-
-            # Create NotionClient with mocked dependency
-            client = NotionClient(
-                token="test_token_12345", version="2022-06-28", timeout=30, timezone_str="Europe/Vienna"
-            )
-
-            # Attach the mock for assertions
-            client._mock_async_client = mock_instance
-            return client
-
-    @pytest.mark.asyncio
     async def test_client_initialization(self, mock_notion_client):
         """Test client initializes with Austrian settings."""
         client = mock_notion_client
@@ -50,7 +70,6 @@ class TestNotionClient:
         assert client.version == "2022-06-28"
         assert client.request_count == 0
 
-    @pytest.mark.asyncio
     async def test_vienna_time_handling(self, mock_notion_client):
         """Test Vienna timezone handling for Austrian efficiency."""
         client = mock_notion_client
@@ -62,124 +81,147 @@ class TestNotionClient:
         assert "." in formatted  # DD.MM.YYYY format
         assert len(formatted.split()[0].split(".")) == 3  # DD.MM.YYYY
 
-    @pytest.mark.asyncio
-    async def test_page_id_validation(self, mock_notion_client):
+    @pytest.mark.parametrize(
+        "page_id",
+        ["12345678901234567890123456789012", "12345678-9012-3456-7890-123456789012"],
+        ids=["bare", "hyphenated"],
+    )
+    async def test_page_id_validation(self, mock_notion_client, page_id):
         """Test page ID validation and formatting."""
         client = mock_notion_client
 
-        # Valid ID without hyphens
-        clean_id = "12345678901234567890123456789012"
-        formatted = client.validate_page_id(clean_id)
-        assert len(formatted) == 36  # With hyphens
-        assert formatted.count("-") == 4
+        formatted = client.validate_page_id(page_id)
+        assert formatted == "12345678-9012-3456-7890-123456789012"  # With hyphens
 
-        # Invalid ID length
-        with pytest.raises(ValueError, match="Invalid page ID format"):
-            client.validate_page_id("too_short")
+    @pytest.mark.parametrize(
+        ("page_id", "message"),
+        [("too_short", "Invalid page ID format"), ("", "Page ID cannot be empty")],
+        ids=["too_short", "empty"],
+    )
+    async def test_invalid_page_id(self, mock_notion_client, page_id, message):
+        """Test malformed page IDs are rejected."""
+        client = mock_notion_client
 
-        # Empty ID
-        with pytest.raises(ValueError, match="Page ID cannot be empty"):
-            client.validate_page_id("")
+        with pytest.raises(ValueError, match=message):
+            client.validate_page_id(page_id)
+
+    @pytest.mark.parametrize(
+        ("outcome", "expected"),
+        [
+            pytest.param(
+                _TEST_USER,
+                {"success": True, "user": _TEST_USER, "timezone": "Europe/Vienna", "requests_made": 1},
+                id="success",
+            ),
+            pytest.param(
+                _ERR_UNAUTHORIZED,
+                {"success": False, "error": "Notion API token is invalid or expired. Check your integration settings."},
+                id="unauthorized",
+            ),
+        ],
+    )
+    async def test_test_connection(self, mock_notion_client, outcome, expected):
+        """Test the connection check reports the user on success and a readable error on failure."""
+        client = mock_notion_client
 
-    @pytest.mark.asyncio
-    async def test_test_connection_success(self, mock_notion_client):
-        """Test successful connection test."""
+        # users.me returns the user or raises the API error
+        client._mock_async_client.users.me.side_effect = [outcome]
+
+        result = await client.test_connection()
+
+        assert {key: result.get(key) for key in expected} == expected
+
+    async def test_transient_error_retried_once(self, mock_notion_client):
+        """Test a timeout is retried once before the call succeeds."""
         client = mock_notion_client
 
-        # Mock successful user response
         mock_user = {"id": "user_123", "name": "Test User", "type": "person"}
-        client._mock_async_client.users.me = AsyncMock(return_value=mock_user)
+        client._mock_async_client.users.me.side_effect = [httpx.ConnectTimeout("slow"), mock_user]
 
-        result = await client.test_connection()
+        with patch("notion_mcp.client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = await client.test_connection()
 
         assert result["success"] is True
-        assert result["user"] == mock_user
-        assert "Austria" in result["timezone"] or "Vienna" in result["timezone"]
-        assert result["requests_made"] == 1
+        assert client._mock_async_client.users.me.await_count == 2
+        mock_sleep.assert_awaited_once()
+        assert client.error_count == 0
 
-    @pytest.mark.asyncio
-    async def test_test_connection_failure(self, mock_notion_client):
-        """Test connection failure handling."""
+    async def test_create_page_not_retried_on_read_timeout(self, mock_notion_client):
+        """Test a write that timed out is not replayed, since Notion may already have created it."""
         client = mock_notion_client
 
-        # Mock API error
-        from notion_client.errors import APIErrorCode, APIResponseError
+        timeout = RequestTimeoutError()
+        timeout.__context__ = httpx.ReadTimeout("slow")
+        client._mock_async_client.pages.create.side_effect = [timeout, {"id": "page_123"}]
 
-        client._mock_async_client.users.me = AsyncMock(
-            side_effect=APIResponseError(
-                code=APIErrorCode.Unauthorized, status=401, message="Unauthorized", headers=Mock(), raw_body_text=""
-            )
-        )
+        with patch("notion_mcp.client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            with pytest.raises(NotionAPIError, match="RequestTimeoutError"):
+                await client.create_page(parent={"page_id": "parent_123"}, properties={})
 
-        result = await client.test_connection()
+        assert client._mock_async_client.pages.create.await_count == 1
+        mock_sleep.assert_not_awaited()
+        assert client.error_count == 1
+
+    async def test_create_page_retried_on_connect_timeout(self, mock_notion_client):
+        """Test a write whose connection never opened is retried, even when wrapped by notion_client."""
+        client = mock_notion_client
+
+        timeout = RequestTimeoutError()
+        timeout.__context__ = httpx.ConnectTimeout("slow")
+        client._mock_async_client.pages.create.side_effect = [timeout, {"id": "page_123"}]
+
+        with patch("notion_mcp.client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = await client.create_page(parent={"page_id": "parent_123"}, properties={})
 
-        assert result["success"] is False
-        assert "token is invalid" in result["error"]
+        assert result == {"id": "page_123"}
+        assert client._mock_async_client.pages.create.await_count == 2
+        mock_sleep.assert_awaited_once()
+        assert client.error_count == 0
 
-    @pytest.mark.asyncio
-    async def test_german_character_support(self, mock_notion_client):
+    @pytest.mark.parametrize("german_text", ["Österreich", "München", "Straße", "Größe"])
+    async def test_german_character_support(self, mock_notion_client, german_text):
         """Test German character handling for Austrian content."""
         client = mock_notion_client
 
-        german_text = "Österreich, München, Straße"
-        cleaned = client.clean_german_text(german_text)
-
         # Should preserve UTF-8 characters
-        assert "Ö" in cleaned
-        assert "ü" in cleaned
-        assert "ß" in cleaned
+        assert client.clean_german_text(german_text) == german_text
 
 
 class TestPageManager:
     """Test page management operations with Austrian efficiency."""
 
-    @pytest.fixture
-    def mock_page_manager(self):
-        """Create mocked PageManager for testing."""
-        mock_client = AsyncMock()
-        manager = PageManager(mock_client)
-        manager.client = mock_client
-        return manager
-
-    @pytest.mark.asyncio
-    async def test_create_page_success(self, mock_page_manager):
-        """Test successful page creation."""
-        manager = mock_page_manager
+    @pytest.mark.parametrize(
+        ("title", "content", "parent_id", "page_id"),
+        [
+            pytest.param(
+                "Test Research Paper", "# Abstract\nThis is a test paper.", "parent_123", "page_123", id="research"
+            ),
+            pytest.param("Österreichische Forschung", "Straße, Größe, Weiß", None, "page_456", id="german"),
+        ],
+    )
+    async def test_create_page(self, make_manager, title, content, parent_id, page_id):
+        """Test page creation, including German content."""
+        manager = make_manager(PageManager)
 
         # Mock page creation response
-        mock_response = {"id": "page_123", "object": "page", "url": "https://notion.so/page_123"}
-        manager.client.create_page = AsyncMock(return_value=mock_response)
+        mock_response = {"id": page_id, "object": "page", "url": f"https://notion.so/{page_id}"}
+        manager.client.create_page.return_value = mock_response
 
-        result = await manager.create_page(
-            title="Test Research Paper", content="# Abstract\nThis is a test paper.", parent_id="parent_123"
-        )
+        result = await manager.create_page(title=title, content=content, parent_id=parent_id)
 
-        assert result["id"] == "page_123"
+        # Should handle German characters without issues
+        assert result["id"] == page_id
         assert result["object"] == "page"
         manager.client.create_page.assert_called_once()
+        sent_title = manager.client.create_page.call_args.kwargs["properties"]["title"]["title"][0]["text"]["content"]
+        assert sent_title == title
 
-    @pytest.mark.asyncio
-    async def test_create_page_with_german_content(self, mock_page_manager):
-        """Test page creation with German content."""
-        manager = mock_page_manager
-
-        mock_response = {"id": "page_456", "object": "page"}
-        manager.client.create_page = AsyncMock(return_value=mock_response)
-
-        result = await manager.create_page(title="Österreichische Forschung", content="Straße, Größe, Weiß")
-
-        # Should handle German characters without issues
-        assert result["id"] == "page_456"
-        call_args = manager.client.create_page.call_args[1]
-        assert "Österreichische" in str(call_args)
-
-    @pytest.mark.asyncio
-    async def test_search_pages(self, mock_page_manager):
+    async def test_search_pages(self, make_manager):
         """Test page search functionality."""
-        manager = mock_page_manager
+        manager = make_manager(PageManager)
 
         mock_search_results = {"results": [{"id": "page_1", "object": "page"}, {"id": "page_2", "object": "page"}]}
-        manager.client.search = AsyncMock(return_value=mock_search_results)
+        manager.client.search.return_value = mock_search_results
 
         results = await manager.search_pages(query="machine learning research", limit=10)
 
@@ -187,10 +229,9 @@ class TestPageManager:
         assert results[0]["id"] == "page_1"
         manager.client.search.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_archive_page_with_backup(self, mock_page_manager):
+    async def test_archive_page_with_backup(self, make_manager):
         """Test page archiving with backup creation."""
-        manager = mock_page_manager
+        manager = make_manager(PageManager)
 
         # Mock page content for backup
         mock_page_content = {"page": {"id": "page_123"}, "blocks": [{"type": "paragraph"}], "children_count": 1}
@@ -198,41 +239,28 @@ class TestPageManager:
 
         # Mock update response
         mock_update_response = {"id": "page_123", "archived": True}
-        manager.client.update_page = AsyncMock(return_value=mock_update_response)
-
-        # Mock Vienna time
-        manager.client.format_austrian_date = Mock(return_value="22.07.2025 18:30")
-        manager.client.get_vienna_time = Mock(return_value=datetime.now())
+        manager.client.update_page.return_value = mock_update_response
 
         result = await manager.archive_page(page_id="page_123", backup_first=True)
 
         assert result["backup_created"] is True
-        assert "22.07.2025" in result["backup_time"]
+        assert result["backup_time"] == AUSTRIAN_DATE
         assert result["action"] == "archived"
 
 
 class TestDatabaseManager:
     """Test database operations with Austrian efficiency."""
 
-    @pytest.fixture
-    def mock_db_manager(self):
-        """Create mocked DatabaseManager for testing."""
-        mock_client = AsyncMock()
-        manager = DatabaseManager(mock_client)
-        manager.client = mock_client
-        return manager
-
-    @pytest.mark.asyncio
-    async def test_create_database_with_schema(self, mock_db_manager):
+    async def test_create_database_with_schema(self, make_manager):
         """Test database creation with property schema."""
-        manager = mock_db_manager
+        manager = make_manager(DatabaseManager)
 
         mock_response = {
             "id": "db_123",
             "object": "database",
             "properties": {"Title": {"title": {}}, "Status": {"select": {"options": []}}},
         }
-        manager.client.create_database = AsyncMock(return_value=mock_response)
+        manager.client.create_database.return_value = mock_response
 
         properties_schema = {
             "Title": "title",
@@ -247,16 +275,15 @@ class TestDatabaseManager:
         assert result["id"] == "db_123"
         manager.client.create_database.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_query_database_with_filters(self, mock_db_manager):
+    async def test_query_database_with_filters(self, make_manager):
         """Test database querying with complex filters."""
-        manager = mock_db_manager
+        manager = make_manager(DatabaseManager)
 
         mock_query_response = {
             "results": [{"id": "entry_1", "properties": {}}, {"id": "entry_2", "properties": {}}],
             "has_more": False,
         }
-        manager.client.query_database = AsyncMock(return_value=mock_query_response)
+        manager.client.query_database.return_value = mock_query_response
 
         result = await manager.query_database(
             database_id="db_123", filter={"Status": {"select": {"equals": "Reading"}}}, limit=50
@@ -266,10 +293,9 @@ class TestDatabaseManager:
         assert result["has_more"] is False
         manager.client.query_database.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_bulk_import_csv_data(self, mock_db_manager):
-        """Test bulk CSV import functionality."""
-        manager = mock_db_manager
+    async def test_bulk_import_records(self, make_manager):
+        """Test bulk import of pre-parsed records."""
+        manager = make_manager(DatabaseManager)
 
         # Mock schema info
         mock_schema = {
@@ -280,50 +306,97 @@ class TestDatabaseManager:
         # Mock entry creation
         manager.create_database_entry = AsyncMock(return_value={"id": "entry_new"})
 
-        # CSV data
-        csv_data = "Title,Rating,Status\nAttack on Titan,9,Completed\nNaruto,8,Watching"
-
-        result = await manager.bulk_import_data(database_id="db_123", data_source=csv_data)
+        result = await manager.bulk_import_data(database_id="db_123", data_source=_BULK_ROWS)
 
         assert result["total_records"] == 2
         assert result["successful_imports"] == 2
         assert result["failed_imports"] == 0
 
+    def test_bulk_import_csv_parsing(self):
+        """Test CSV text is parsed into one record per row."""
+        csv_data = "Title,Rating,Status\nAttack on Titan,9,Completed\nNaruto,8,Watching"
+
+        records = list(DatabaseManager._iter_import_records(csv_data))
+
+        assert records == [{key: str(value) for key, value in row.items()} for row in _BULK_ROWS]
+
+    async def test_bulk_import_csv_file(self, make_manager, tmp_path):
+        """Test bulk import streams rows from a CSV file Path."""
+        manager = make_manager(DatabaseManager)
+
+        manager.get_database_schema = AsyncMock(return_value={"properties": {"Title": {"type": "title"}}})
+        manager.create_database_entry = AsyncMock(return_value={"id": "entry_new"})
+
+        csv_path = tmp_path / "anime.csv"
+        csv_path.write_text("Name\nAttack on Titan\nNaruto\nOne Piece\n", encoding="utf-8")
+
+        result = await manager.bulk_import_data(database_id="db_123", data_source=csv_path, mapping={"Name": "Title"})
+
+        assert result["total_records"] == 3
+        assert result["successful_imports"] == 3
+        manager.create_database_entry.assert_awaited_with(database_id="db_123", properties={"Title": "One Piece"})
+
+    async def test_bulk_import_string_never_read_as_path(self, make_manager, tmp_path):
+        """Test a string naming an existing file is parsed as CSV data, not opened."""
+        manager = make_manager(DatabaseManager)
+        manager.get_database_schema = AsyncMock(return_value={"properties": {"Title": {"type": "title"}}})
+
+        csv_path = tmp_path / "anime.csv"
+        csv_path.write_text("Name\nAttack on Titan\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="No data provided"):
+            await manager.bulk_import_data(database_id="db_123", data_source=str(csv_path))
+
+    async def test_bulk_import_bounded_concurrency(self, make_manager):
+        """Test bulk import overlaps row writes without exceeding the concurrency limit."""
+        manager = make_manager(DatabaseManager)
+
+        manager.get_database_schema = AsyncMock(return_value={"properties": {"Title": {"type": "title"}}})
+
+        in_flight = 0
+        peak = 0
+
+        async def create_entry(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if kwargs["properties"]["Title"] == "Row 3":
+                raise Exception("Invalid request data")
+            return {"id": "entry_new"}
+
+        manager.create_database_entry = create_entry
+
+        rows = [{"Title": f"Row {n}"} for n in range(1, 9)]
+        result = await manager.bulk_import_data(database_id="db_123", data_source=rows, concurrency=3)
+
+        assert result["total_records"] == 8
+        assert result["successful_imports"] == 7
+        assert [error["row"] for error in result["errors"]] == [3]
+        assert 1 < peak <= 3
+
 
 class TestCollaborationManager:
     """Test collaboration features with Austrian efficiency."""
 
-    @pytest.fixture
-    def mock_collab_manager(self):
-        """Create mocked CollaborationManager for testing."""
-        mock_client = AsyncMock()
-        manager = CollaborationManager(mock_client)
-        manager.client = mock_client
-        return manager
-
-    @pytest.mark.asyncio
-    async def test_add_comment(self, mock_collab_manager):
+    async def test_add_comment(self, make_manager):
         """Test comment addition functionality."""
-        manager = mock_collab_manager
-
-        # Mock Vienna time formatting
-        manager.client.format_austrian_date = Mock(return_value="22.07.2025 18:30")
-        manager.client.get_vienna_time = Mock(return_value=datetime.now())
+        manager = make_manager(CollaborationManager)
 
         # Mock comment creation
-        manager.client.create_comment = AsyncMock(return_value={"id": "comment_123"})
+        manager.client.create_comment.return_value = {"id": "comment_123"}
 
         result = await manager.add_comment(page_id="page_123", content="Great research! Needs more references.")
 
         assert result["type"] == "comment"
         assert result["content"] == "Great research! Needs more references."
-        assert "22.07.2025" in result["created_time"]
+        assert result["created_time"] == AUSTRIAN_DATE
         manager.client.create_comment.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_get_workspace_users(self, mock_collab_manager):
+    async def test_get_workspace_users(self, make_manager):
         """Test workspace user retrieval."""
-        manager = mock_collab_manager
+        manager = make_manager(CollaborationManager)
 
         mock_users_response = {
             "results": [
@@ -332,7 +405,7 @@ class TestCollaborationManager:
             ],
             "has_more": False,
         }
-        manager.client.get_users = AsyncMock(return_value=mock_users_response)
+        manager.client.get_users.return_value = mock_users_response
 
         users = await manager.get_workspace_users(include_inactive=False, sort_by="name")
 
@@ -344,22 +417,9 @@ class TestCollaborationManager:
 class TestAutomationManager:
     """Test automation and AI features with Austrian efficiency."""
 
-    @pytest.fixture
-    def mock_automation_manager(self):
-        """Create mocked AutomationManager for testing."""
-        mock_client = AsyncMock()
-        manager = AutomationManager(mock_client)
-        manager.client = mock_client
-        return manager
-
-    @pytest.mark.asyncio
-    async def test_setup_automation(self, mock_automation_manager):
+    async def test_setup_automation(self, make_manager):
         """Test automation setup with webhook."""
-        manager = mock_automation_manager
-
-        # Mock Vienna time
-        manager.client.format_austrian_date = Mock(return_value="22.07.2025 18:30")
-        manager.client.get_vienna_time = Mock(return_value=datetime.now())
+        manager = make_manager(AutomationManager)
 
         result = await manager.setup_automation(
             trigger_type="page_created",
@@ -372,95 +432,68 @@ class TestAutomationManager:
         assert "automation_" in result["automation_id"]
         assert result["config"]["trigger_type"] == "page_created"
 
-    @pytest.mark.asyncio
-    async def test_generate_ai_summary(self, mock_automation_manager):
+    async def test_generate_ai_summary(self, make_manager):
         """Test AI summary generation."""
-        manager = mock_automation_manager
-
-        # Mock page content
-        mock_page_content = {
-            "blocks": [
-                {
-                    "type": "paragraph",
-                    "paragraph": {"rich_text": [{"plain_text": "This is research about machine learning."}]},
-                }
-            ]
-        }
-
-        # Mock PageManager
-        with patch("notion_mcp.pages.PageManager") as mock_page_manager:
-            mock_pm_instance = AsyncMock()
-            mock_pm_instance.get_page_content = AsyncMock(return_value=mock_page_content)
-            mock_page_manager.return_value = mock_pm_instance
-
-            # Mock Vienna time
-            manager.client.format_austrian_date = Mock(return_value="22.07.2025 18:30")
+        manager = make_manager(AutomationManager)
 
+        with patch.object(pages, "PageManager", _PAGE_MANAGER_STUB):
             result = await manager.generate_ai_summary(page_id="page_123", summary_type="comprehensive")
 
+        _PAGE_MANAGER_STUB.assert_called_with(manager.client)
         assert result["success"] is True
         assert "ai_summary" in result
         assert result["ai_summary"]["word_count"] > 0
 
-    @pytest.mark.asyncio
-    async def test_export_workspace_data(self, mock_automation_manager):
+    async def test_export_workspace_data(self, make_manager):
         """Test workspace export functionality."""
-        manager = mock_automation_manager
+        manager = make_manager(AutomationManager)
 
-        # Mock Vienna time
-        manager.client.format_austrian_date = Mock(return_value="22.07.2025 18:30")
-        manager.client.get_vienna_time = Mock(return_value=datetime.now())
         manager.client.timezone = "Europe/Vienna"
 
         result = await manager.export_workspace_data(scope="workspace", format="json", include_metadata=True)
 
         assert result["success"] is True
         assert result["export_config"]["scope"] == "workspace"
-        assert "22.07.2025" in result["export_config"]["started_time"]
+        assert result["export_config"]["started_time"] == AUSTRIAN_DATE
 
 
 class TestErrorHandling:
     """Test error handling with Austrian efficiency - no gaslighting."""
 
-    @pytest.mark.asyncio
-    async def test_api_error_handling(self):
+    @pytest.mark.parametrize(
+        ("error", "match"),
+        [(_ERR_NOT_FOUND, "not found"), (_ERR_RATE_LIMITED, "Rate limit exceeded")],
+        ids=["not_found", "rate_limited"],
+    )
+    async def test_api_error_handling(self, mock_notion_client, error, match):
         """Test proper API error handling without gaslighting."""
-        from notion_client.errors import APIErrorCode, APIResponseError
-
-        mock_client = AsyncMock()
-        mock_client.pages.retrieve = AsyncMock(
-            side_effect=APIResponseError(
-                code=APIErrorCode.ObjectNotFound, status=404, message="Object not found", headers=Mock(), raw_body_text=""
-            )
-        )
-
-        client = NotionClient("test_token")
-        client.client = mock_client
+        client = mock_notion_client
+        client._mock_async_client.pages.retrieve.side_effect = error
 
-        with pytest.raises(Exception, match="not found"):
+        with pytest.raises(NotionAPIError, match=match):
             await client.get_page("12345678901234567890123456789012")
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_handling(self):
-        """Test rate limit error handling."""
-        from notion_client.errors import APIErrorCode, APIResponseError
+    async def test_collaboration_api_errors_propagate(self):
+        """Test collaboration failures from the client reach the caller as NotionAPIError."""
+        collab = CollaborationManager(AsyncMock())
+        collab.client.list_comments = AsyncMock(side_effect=NotionAPIError("Rate limit exceeded"))
 
-        mock_client = AsyncMock()
-        mock_client.pages.retrieve = AsyncMock(
-            side_effect=APIResponseError(
-                code=APIErrorCode.RateLimited, status=429, message="Rate limited", headers=Mock(), raw_body_text=""
-            )
-        )
+        with pytest.raises(NotionAPIError, match="Rate limit exceeded"):
+            await collab.get_comments(page_id="page_123")
 
-        client = NotionClient("test_token")
-        client.client = mock_client
-        
-        with pytest.raises(Exception, match="Rate limit exceeded"):
-            await client.get_page("12345678901234567890123456789012")
+    async def test_collaboration_bugs_not_converted(self):
+        """Test programming errors are not disguised as expected NotionAPIError failures."""
+        collab = CollaborationManager(AsyncMock())
+        collab.client.list_comments = AsyncMock(return_value=None)
+
+        with pytest.raises(AttributeError):
+            await collab.get_comments(page_id="page_123")
 
+    async def test_bulk_import_rejects_empty_data(self):
+        """Test bulk import raises ValueError rather than bare Exception for empty input."""
+        with pytest.raises(ValueError, match="No data provided"):
+            await DatabaseManager(AsyncMock()).bulk_import_data(database_id="db_123", data_source=[])
 
-# Test configuration
-pytest_plugins = []
 
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
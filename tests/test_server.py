@@ -0,0 +1,47 @@
+"""
+NotionMCP - Server Helper Tests
+Checks for server.py helpers that run without a Notion client or MCP session.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import server
+
+
+class TestImportFile:
+    """Test bulk-import file names stay confined to the import directory."""
+
+    def test_resolves_inside_import_dir(self, tmp_path, monkeypatch):
+        """Test a plain file name resolves inside NOTION_IMPORT_DIR."""
+        monkeypatch.setenv("NOTION_IMPORT_DIR", str(tmp_path))
+
+        assert server._import_file("anime.csv") == tmp_path.resolve() / "anime.csv"
+
+    @pytest.mark.parametrize("name", ["../secret.csv", "/etc/passwd", "nested/../../secret.json", "notes.txt"])
+    def test_rejects_names_outside_import_dir(self, tmp_path, monkeypatch, name):
+        """Test names escaping the import directory, or with other suffixes, are rejected."""
+        monkeypatch.setenv("NOTION_IMPORT_DIR", str(tmp_path / "imports"))
+
+        with pytest.raises(ValueError, match="inside"):
+            server._import_file(name)
+
+
+class TestConnectionProbe:
+    """Test the memoized users.me probe behind the test_connection tool."""
+
+    async def test_connection_failure_not_memoized(self, monkeypatch):
+        """Test a failed probe is not cached, so recovery shows up on the next poll."""
+        monkeypatch.setattr(server, "_connection_probe", None)
+        client = Mock()
+        client.test_connection = AsyncMock(side_effect=[{"success": False, "error": "Unauthorized"}, {"success": True}])
+
+        failed = await server._probe_connection(client)
+        recovered = await server._probe_connection(client)
+        cached = await server._probe_connection(client)
+
+        assert failed["success"] is False
+        assert recovered["success"] is True
+        assert cached is recovered
+        assert client.test_connection.await_count == 2